@@ -0,0 +1,53 @@
+# Generated by Django 5.2.18 on 2026-10-17 21:48
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+
+SEARCH_CONFIGS = {"tr": "turkish", "en": "english"}
+SEARCH_FIELDS = {
+    "BlogPost": (("title", "A"), ("meta_description", "B"), ("content", "C")),
+}
+
+
+def populate_search_vectors(apps, schema_editor):
+    for model_name, weighted_fields in SEARCH_FIELDS.items():
+        model = apps.get_model("blog", model_name)
+        vectors = {}
+        for lang_code, config in SEARCH_CONFIGS.items():
+            vector = None
+            for field_name, weight in weighted_fields:
+                part = SearchVector(f"{field_name}_{lang_code}", config=config, weight=weight)
+                vector = part if vector is None else vector + part
+            vectors[f"search_vector_{lang_code}"] = vector
+        model.objects.update(**vectors)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0002_alter_blogpost_collection_alter_blogpost_content_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogpost',
+            name='search_vector_en',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='search_vector_tr',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='blogpost',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector_tr'], name='blogpost_search_tr_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='blogpost',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector_en'], name='blogpost_search_en_gin'),
+        ),
+        migrations.RunPython(populate_search_vectors, migrations.RunPython.noop),
+    ]
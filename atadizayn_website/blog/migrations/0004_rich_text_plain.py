@@ -0,0 +1,80 @@
+# Generated by Django 5.2.18 on 2026-10-17 21:51
+
+import html
+import re
+
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations, models
+from django.utils.html import strip_tags
+
+BATCH_SIZE = 200
+# Frozen copy of core.text_utils.html_to_plain_text as of this migration, so later changes to it do not alter it.
+BLOCK_BOUNDARY_PATTERN = re.compile(
+    r"<\s*(br|/p|/div|/li|/h[1-6]|/td|/th|/tr|/blockquote|/figcaption)\b[^>]*>", re.IGNORECASE
+)
+SEARCH_CONFIGS = {"tr": "turkish", "en": "english"}
+PLAIN_TEXT_FIELDS = {
+    "BlogPost": ("content", "content_plain"),
+}
+SEARCH_FIELDS = {
+    "BlogPost": (("title", "A"), ("meta_description", "B"), ("content_plain", "C")),
+}
+
+
+def html_to_plain_text(value):
+    text = BLOCK_BOUNDARY_PATTERN.sub(" ", value or "")
+    text = html.unescape(strip_tags(text)).replace("\xa0", " ")
+    return " ".join(text.split())
+
+
+def backfill_plain_text(apps, schema_editor):
+    for model_name, (source_field, target_field) in PLAIN_TEXT_FIELDS.items():
+        model = apps.get_model("blog", model_name)
+        update_fields = [f"{target_field}_{lang_code}" for lang_code in SEARCH_CONFIGS]
+        batch = []
+        for instance in model.objects.order_by("pk").iterator(chunk_size=BATCH_SIZE):
+            for lang_code in SEARCH_CONFIGS:
+                source_value = getattr(instance, f"{source_field}_{lang_code}")
+                setattr(instance, f"{target_field}_{lang_code}", html_to_plain_text(source_value))
+            batch.append(instance)
+            if len(batch) >= BATCH_SIZE:
+                model.objects.bulk_update(batch, update_fields)
+                batch = []
+        if batch:
+            model.objects.bulk_update(batch, update_fields)
+
+        # Search vectors now index the plain-text columns instead of the HTML.
+        vectors = {}
+        for lang_code, config in SEARCH_CONFIGS.items():
+            vector = None
+            for field_name, weight in SEARCH_FIELDS[model_name]:
+                part = SearchVector(f"{field_name}_{lang_code}", config=config, weight=weight)
+                vector = part if vector is None else vector + part
+            vectors[f"search_vector_{lang_code}"] = vector
+        model.objects.update(**vectors)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0003_search_vectors'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogpost',
+            name='content_plain',
+            field=models.TextField(blank=True, default='', editable=False, verbose_name='Sayfa İçeriği (düz)'),
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='content_plain_en',
+            field=models.TextField(blank=True, default='', editable=False, null=True, verbose_name='Sayfa İçeriği (düz)'),
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='content_plain_tr',
+            field=models.TextField(blank=True, default='', editable=False, null=True, verbose_name='Sayfa İçeriği (düz)'),
+        ),
+        migrations.RunPython(backfill_plain_text, migrations.RunPython.noop),
+    ]
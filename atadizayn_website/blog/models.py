@@ -1,19 +1,22 @@
 from autoslug import AutoSlugField
-from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.urls import reverse
 from django.utils import timezone
-from django.utils.html import strip_tags
-from django.utils.text import slugify
 from django.utils.translation import gettext_lazy as _
 from django_ckeditor_5.fields import CKEditor5Field
 
+from atadizayn_website.core.image_utils import image_derivatives_on_commit
+from atadizayn_website.core.search_utils import update_search_vectors
 from atadizayn_website.core.slug_utils import (
-    build_slug_lookup_q,
+    fill_unique_slugs,
     get_default_lang_code,
     get_translated_slug,
+    validate_unique_slugs,
 )
+from atadizayn_website.core.text_utils import html_to_plain_text, sync_plain_text_fields
 
 
 class BlogPost(models.Model):
@@ -27,6 +30,12 @@ class BlogPost(models.Model):
         ('post', _('Blog paylaşımları')),
         ('corporate', _('Kurumsal')),
     )
+    SEARCH_FIELDS = (
+        ("title", "A"),
+        ("meta_description", "B"),
+        ("content_plain", "C"),
+    )
+    PLAIN_TEXT_FIELDS = {"content": "content_plain"}
 
     # --- Core Page Data ---
     title = models.CharField(
@@ -57,6 +66,12 @@ class BlogPost(models.Model):
         null=True,
         config_name='page_design',
     )
+    content_plain = models.TextField(
+        blank=True,
+        default="",
+        editable=False,
+        verbose_name=_("Sayfa İçeriği (düz)"),
+    )
 
     # --- Visuals ---
     cover_image = models.ImageField(
@@ -71,6 +86,12 @@ class BlogPost(models.Model):
         null=True,
         verbose_name=_("Kapak Görseli Alt Metni"),
     )
+    cover_image_variants = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        verbose_name=_("Kapak görseli türevleri"),
+    )
     collection = models.CharField(
         max_length=20,
         choices=COLLECTION_CHOICES,
@@ -100,10 +121,24 @@ class BlogPost(models.Model):
     created_at = models.DateTimeField(auto_now_add=True, verbose_name=_("Oluşturulma Tarihi"))
     updated_at = models.DateTimeField(auto_now=True, verbose_name=_("Güncellenme Tarihi"))
 
+    search_vector_tr = SearchVectorField(null=True, editable=False)
+    search_vector_en = SearchVectorField(null=True, editable=False)
+
     class Meta:
         ordering = ['-publish_date']
         verbose_name = _('Blog Yazısı')
         verbose_name_plural = _('Blog Yazıları')
+        indexes = [
+            GinIndex(fields=["search_vector_tr"], name="blogpost_search_tr_gin"),
+            GinIndex(fields=["search_vector_en"], name="blogpost_search_en_gin"),
+            # Blog indexes, the home page's latest posts and the footer only read published posts of a collection,
+            # newest first (the home page uses DISTINCT ON (collection) ... ORDER BY publish_date DESC, id DESC).
+            models.Index(
+                fields=["collection", "-publish_date", "-id"],
+                condition=models.Q(status="published"),
+                name="blogpost_published_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.title
@@ -112,13 +147,19 @@ class BlogPost(models.Model):
         # Auto-fill alt text if missing
         if self.cover_image and not self.cover_image_alt:
             self.cover_image_alt = self.title
+        fill_unique_slugs(self, "title")
+
+        for source_field, target_field in self.PLAIN_TEXT_FIELDS.items():
+            sync_plain_text_fields(self, source_field, target_field)
 
         if not (self.meta_description or "").strip():
-            plain_content = strip_tags(self.content or "").strip()
+            plain_content = self.content_plain
             if plain_content:
                 self.meta_description = plain_content[:160]
 
-        super().save(*args, **kwargs)
+        with image_derivatives_on_commit(self, "cover_image", "cover_image_variants"):
+            super().save(*args, **kwargs)
+        update_search_vectors(type(self).objects.filter(pk=self.pk), self.SEARCH_FIELDS)
 
     def get_absolute_url(self) -> str:
         current_slug = get_translated_slug(self)
@@ -142,61 +183,7 @@ class BlogPost(models.Model):
         if errors:
             raise ValidationError(errors)
 
-        reserved_slugs = {
-            slug.lower()
-            for slug in getattr(
-                settings,
-                "RESERVED_CATEGORY_SLUGS",
-                (
-                    "blog",
-                    "admin",
-                    "search",
-                    "politikalar",
-                    "i18n",
-                    "ckeditor5",
-                    "kitchen_sink",
-                    "injection-products",
-                    "pos-display-stands",
-                ),
-            )
-        }
-        slug_candidates = {
-            "slug": (self.slug or slugify((self.title or "").strip(), allow_unicode=False)).strip().lower(),
-            "slug_en": (
-                (
-                    getattr(self, "slug_en", "")
-                    or slugify(((getattr(self, "title_en", None) or "").strip()), allow_unicode=False)
-                )
-                .strip()
-                .lower()
-            ),
-            "slug_tr": (
-                (
-                    getattr(self, "slug_tr", "")
-                    or slugify(((getattr(self, "title_tr", None) or "").strip()), allow_unicode=False)
-                )
-                .strip()
-                .lower()
-            ),
-        }
-
-        errors = {}
-        for field_name, slug_value in slug_candidates.items():
-            if slug_value and slug_value in reserved_slugs:
-                errors[field_name] = _("Bu slug kullanılamaz.")
-
-        queryset = type(self).objects.all()
-        if self.pk:
-            queryset = queryset.exclude(pk=self.pk)
-
-        for field_name, slug_value in slug_candidates.items():
-            if not slug_value:
-                continue
-            if queryset.filter(build_slug_lookup_q(slug_value)).exists():
-                errors[field_name] = _("Bu slug başka bir blog yazısında kullanılıyor.")
-
-        if errors:
-            raise ValidationError(errors)
+        validate_unique_slugs(self, "title", _("Bu slug başka bir blog yazısında kullanılıyor."))
 
         if self.cover_image:
             width = getattr(self.cover_image, "width", None)
@@ -206,5 +193,4 @@ class BlogPost(models.Model):
 
     @staticmethod
     def _has_visible_text(value: str) -> bool:
-        plain_value = strip_tags(value or "").replace("\xa0", " ").strip()
-        return bool(plain_value)
+        return bool(html_to_plain_text(value))
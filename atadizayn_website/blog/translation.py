@@ -14,6 +14,7 @@ class BlogPostTranslationOptions(TranslationOptions):
         "slug",
         "meta_description",
         "content",
+        "content_plain",
     )
     fallback_languages = {"default": ("tr",), "en": ("tr",)}
     fallback_undefined = {
@@ -2,10 +2,12 @@ from django.utils import timezone
 from django.core.paginator import Paginator
 from django.http import Http404
 from django.shortcuts import render
+from django.utils.decorators import method_decorator
 from django.views.generic import DetailView
 from django.utils.translation import gettext_lazy as _
 
-from atadizayn_website.core.slug_utils import build_active_language_slug_lookup_q
+from atadizayn_website.core.page_cache_utils import cache_anonymous_page, conditional_page
+from atadizayn_website.core.slug_map_utils import blog_post_slugs, require_known_slugs
 
 from .models import BlogPost
 
@@ -29,6 +31,14 @@ def _published_posts_queryset():
     return BlogPost.objects.filter(status="published", publish_date__lte=timezone.now()).order_by("-publish_date")
 
 
+def _get_post_last_modified(request, slug):
+    post_pk = blog_post_slugs.resolve(slug)
+    if post_pk is None:
+        return None
+    return _published_posts_queryset().filter(pk=post_pk).values_list("updated_at", flat=True).first()
+
+
+@cache_anonymous_page
 def blog_index(request):
     posts_queryset = _published_posts_queryset().filter(collection="post")
     paginator = Paginator(posts_queryset, 6)
@@ -45,6 +55,7 @@ def blog_index(request):
     )
 
 
+@cache_anonymous_page
 def blog_collection_index(request, collection):
     if collection not in COLLECTION_LABELS:
         raise Http404
@@ -64,6 +75,9 @@ def blog_collection_index(request, collection):
     )
 
 
+@method_decorator(require_known_slugs(slug=blog_post_slugs), name="dispatch")
+@method_decorator(conditional_page(_get_post_last_modified), name="dispatch")
+@method_decorator(cache_anonymous_page, name="dispatch")
 class BlogDetailView(DetailView):
     model = BlogPost
     template_name = "blog/detail.html"
@@ -74,8 +88,10 @@ class BlogDetailView(DetailView):
 
     def get_object(self, queryset=None):
         queryset = queryset or self.get_queryset()
-        slug = self.kwargs["slug"]
+        post_pk = blog_post_slugs.resolve(self.kwargs["slug"])
+        if post_pk is None:
+            raise Http404(_("Blog yazısı bulunamadı."))
         try:
-            return queryset.get(build_active_language_slug_lookup_q(slug))
+            return queryset.get(pk=post_pk)
         except BlogPost.DoesNotExist:
             raise Http404(_("Blog yazısı bulunamadı."))
@@ -5,3 +5,6 @@ from django.utils.translation import gettext_lazy as _
 class CoreConfig(AppConfig):
     name = "atadizayn_website.core"
     verbose_name = _("Temel Özellikler")
+
+    def ready(self):
+        from atadizayn_website.core import checks, signals  # noqa: F401
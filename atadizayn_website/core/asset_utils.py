@@ -0,0 +1,41 @@
+import os
+
+from atadizayn_website.core.cache_utils import VersionedProcessCache
+from atadizayn_website.core.models import SiteAsset
+
+SITE_ASSET_CACHE_NAMESPACE = "site-assets"
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".gif", ".svg", ".webp")
+VIDEO_EXTENSIONS = (".mp4", ".webm", ".ogg", ".mov")
+
+
+def get_asset_media_type(file_name: str) -> str:
+    ext = os.path.splitext(file_name or "")[1].lower()
+    if ext in IMAGE_EXTENSIONS:
+        return "image"
+    if ext in VIDEO_EXTENSIONS:
+        return "video"
+    return "file"
+
+
+def load_site_assets(_key=None) -> dict:
+    # Storage .url is resolved once here instead of on every tag call (S3 URL building is not free).
+    registry = {}
+    for asset in SiteAsset.objects.exclude(file="").exclude(file__isnull=True):
+        registry[asset.key] = {
+            "key": asset.key,
+            "url": asset.file.url,
+            "media_type": get_asset_media_type(asset.file.name),
+            "width": asset.width,
+            "height": asset.height,
+            "label": asset.description or asset.key,
+        }
+    return registry
+
+
+# Assets are not translated, so the registry holds a single table.
+site_assets = VersionedProcessCache(SITE_ASSET_CACHE_NAMESPACE, load_site_assets)
+
+
+def get_site_asset(key: str):
+    return site_assets.get("all").get(key)
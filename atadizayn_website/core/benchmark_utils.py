@@ -0,0 +1,231 @@
+import math
+import random
+import statistics
+from datetime import timedelta
+
+from django.db import connection
+from django.utils import timezone
+
+from atadizayn_website.blog.models import BlogPost
+from atadizayn_website.core.search_utils import update_search_vectors
+from atadizayn_website.core.text_utils import html_to_plain_text
+from atadizayn_website.products.models import Category, Product, ProductVariant
+
+# Aligned (Turkish, English) vocabulary so every synthetic row reads naturally in both languages.
+BENCHMARK_NOUNS = (
+    ("raf", "shelf"),
+    ("klips", "clip"),
+    ("bağlantı parçası", "connector"),
+    ("stand", "stand"),
+    ("teşhir ünitesi", "display unit"),
+    ("ışıklı pano", "illuminated panel"),
+    ("askı", "hanger"),
+    ("kanca", "hook"),
+    ("profil", "profile"),
+    ("etiketlik", "label holder"),
+    ("tutucu", "holder"),
+    ("ayak", "foot"),
+    ("kapak", "cover"),
+    ("çerçeve", "frame"),
+    ("döner sergi", "rotating exhibit"),
+    ("broşürlük", "brochure holder"),
+)
+BENCHMARK_ADJECTIVES = (
+    ("büyük", "large"),
+    ("küçük", "small"),
+    ("şeffaf", "transparent"),
+    ("beyaz", "white"),
+    ("siyah", "black"),
+    ("metal", "metal"),
+    ("plastik", "plastic"),
+    ("güçlendirilmiş", "reinforced"),
+    ("çift taraflı", "double-sided"),
+    ("ayarlanabilir", "adjustable"),
+)
+BENCHMARK_SENTENCES = (
+    (
+        "Mağaza içi teşhir için enjeksiyon kalıplama ile üretilir.",
+        "Produced by injection moulding for in-store display.",
+    ),
+    (
+        "Ağır yük altında eğilmeyen, uzun ömürlü bir yapıya sahiptir.",
+        "Built to last without bending under heavy loads.",
+    ),
+    (
+        "Kurulumu alet gerektirmez, saniyeler içinde takılır.",
+        "Installs in seconds without any tools.",
+    ),
+    (
+        "Marka renklerine göre özel üretim yapılabilir.",
+        "Can be custom produced in brand colours.",
+    ),
+    (
+        "Standart raf sistemlerinin tamamıyla uyumludur.",
+        "Compatible with all standard shelving systems.",
+    ),
+)
+BENCHMARK_CODE_PREFIXES = ("RK", "ST", "BX", "PN", "AK")
+
+# (language, query) pairs covering prefix, multi-word, SKU, typo, Turkish-casing and empty-result paths.
+BENCHMARK_QUERIES = (
+    ("tr", "raf"),
+    ("tr", "bağ"),
+    ("tr", "ışıklı pano"),
+    ("tr", "KAPAK"),
+    ("en", "shelf"),
+    ("en", "display unit"),
+    ("en", "hook"),
+    ("tr", "RK-B0001"),
+    ("tr", "BX-B00"),
+    ("tr", "ST-BOO12"),
+    ("en", "zzzz"),
+)
+
+
+def _pick(rng: random.Random, pool):
+    return pool[rng.randrange(len(pool))]
+
+
+def _build_names(rng: random.Random):
+    adjective_tr, adjective_en = _pick(rng, BENCHMARK_ADJECTIVES)
+    noun_tr, noun_en = _pick(rng, BENCHMARK_NOUNS)
+    return f"{adjective_tr} {noun_tr}".capitalize(), f"{adjective_en} {noun_en}".capitalize()
+
+
+def _build_rich_text(rng: random.Random, heading_tr: str, heading_en: str):
+    # Mirrors what editors produce in CKEditor: headings, paragraphs with inline markup, lists and entities.
+    sentences = [_pick(rng, BENCHMARK_SENTENCES) for _index in range(rng.randint(3, 6))]
+    features = [_pick(rng, BENCHMARK_ADJECTIVES) for _index in range(rng.randint(2, 4))]
+    html_by_lang = []
+    for lang_index, heading in enumerate((heading_tr, heading_en)):
+        paragraphs = "".join(f"<p>{sentence[lang_index]}&nbsp;</p>" for sentence in sentences)
+        items = "".join(f"<li><strong>{feature[lang_index]}</strong></li>" for feature in features)
+        html_by_lang.append(f"<h2>{heading}</h2>{paragraphs}<ul>{items}</ul>")
+    return html_by_lang
+
+
+def seed_benchmark_catalog(size: int, seed: int = 0):
+    """
+    Inserts a synthetic bilingual catalog of `size` products with roughly size/20 categories,
+    three variants per product and size/5 blog posts, then fills plain-text and search-vector columns.
+    Meant to run inside a transaction that the caller rolls back.
+    """
+    rng = random.Random(seed)
+    category_count = max(1, size // 20)
+    post_count = max(1, size // 5)
+
+    categories = []
+    for index in range(category_count):
+        name_tr, name_en = _build_names(rng)
+        rich_text_tr, rich_text_en = _build_rich_text(rng, name_tr, name_en)
+        categories.append(
+            Category(
+                name_tr=f"{name_tr} {index}",
+                name_en=f"{name_en} {index}",
+                slug=f"benchmark-category-{index}",
+                slug_tr=f"benchmark-category-{index}",
+                slug_en=f"benchmark-category-{index}-en",
+                collection=_pick(rng, Category.COLLECTION_CHOICES)[0],
+                rich_text_tr=rich_text_tr,
+                rich_text_en=rich_text_en,
+                rich_text_plain_tr=html_to_plain_text(rich_text_tr),
+                rich_text_plain_en=html_to_plain_text(rich_text_en),
+                description_tr=html_to_plain_text(rich_text_tr)[:300],
+                description_en=html_to_plain_text(rich_text_en)[:300],
+            )
+        )
+    categories = Category.objects.bulk_create(categories)
+
+    products = []
+    for index in range(size):
+        name_tr, name_en = _build_names(rng)
+        rich_text_tr, rich_text_en = _build_rich_text(rng, name_tr, name_en)
+        products.append(
+            Product(
+                category=categories[index % category_count],
+                name_tr=f"{name_tr} {index}",
+                name_en=f"{name_en} {index}",
+                slug=f"benchmark-product-{index}",
+                slug_tr=f"benchmark-product-{index}",
+                slug_en=f"benchmark-product-{index}-en",
+                rich_text_tr=rich_text_tr,
+                rich_text_en=rich_text_en,
+                rich_text_plain_tr=html_to_plain_text(rich_text_tr),
+                rich_text_plain_en=html_to_plain_text(rich_text_en),
+                description_tr=html_to_plain_text(rich_text_tr)[:300],
+                description_en=html_to_plain_text(rich_text_en)[:300],
+            )
+        )
+    products = Product.objects.bulk_create(products, batch_size=1000)
+
+    variants = []
+    for index, product in enumerate(products):
+        for variant_index in range(3):
+            size_tr, size_en = _pick(rng, BENCHMARK_ADJECTIVES)
+            prefix = BENCHMARK_CODE_PREFIXES[(index + variant_index) % len(BENCHMARK_CODE_PREFIXES)]
+            variants.append(
+                ProductVariant(
+                    product=product,
+                    code=f"{prefix}-B{index * 3 + variant_index:05d}",
+                    size_tr=f"{size_tr} {rng.randint(10, 90)}x{rng.randint(10, 90)} cm",
+                    size_en=f"{size_en} {rng.randint(10, 90)}x{rng.randint(10, 90)} cm",
+                    package_quantity=str(rng.choice((10, 25, 50, 100))),
+                )
+            )
+    ProductVariant.objects.bulk_create(variants, batch_size=1000)
+
+    now = timezone.now()
+    posts = []
+    for index in range(post_count):
+        title_tr, title_en = _build_names(rng)
+        content_tr, content_en = _build_rich_text(rng, title_tr, title_en)
+        posts.append(
+            BlogPost(
+                title_tr=f"{title_tr} rehberi {index}",
+                title_en=f"{title_en} guide {index}",
+                slug=f"benchmark-post-{index}",
+                slug_tr=f"benchmark-post-{index}",
+                slug_en=f"benchmark-post-{index}-en",
+                content_tr=content_tr,
+                content_en=content_en,
+                content_plain_tr=html_to_plain_text(content_tr),
+                content_plain_en=html_to_plain_text(content_en),
+                collection=rng.choice(("post", "announcement")),
+                status="published",
+                publish_date=now - timedelta(days=rng.randint(1, 720)),
+            )
+        )
+    posts = BlogPost.objects.bulk_create(posts, batch_size=1000)
+
+    for model, instances in ((Category, categories), (Product, products), (BlogPost, posts)):
+        update_search_vectors(model.objects.filter(pk__in=[instance.pk for instance in instances]), model.SEARCH_FIELDS)
+
+    # Fresh rows have no planner statistics; analyze so plans match a long-lived production table.
+    with connection.cursor() as cursor:
+        for model in (Category, Product, ProductVariant, BlogPost):
+            cursor.execute(f"ANALYZE {connection.ops.quote_name(model._meta.db_table)}")
+
+    return {
+        "categories": len(categories),
+        "products": len(products),
+        "variants": len(variants),
+        "posts": len(posts),
+    }
+
+
+def percentile(samples, pct: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    rank = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[rank]
+
+
+def summarize_samples(durations, query_counts):
+    return {
+        "p50_ms": percentile(durations, 50) * 1000,
+        "p95_ms": percentile(durations, 95) * 1000,
+        "p99_ms": percentile(durations, 99) * 1000,
+        "mean_ms": statistics.fmean(durations) * 1000 if durations else 0.0,
+        "queries": max(query_counts) if query_counts else 0,
+    }
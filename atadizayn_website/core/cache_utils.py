@@ -0,0 +1,74 @@
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+CACHE_VERSION_KEY_PREFIX = "cache-version"
+
+
+def get_cache_version_key(namespace: str) -> str:
+    return f"{CACHE_VERSION_KEY_PREFIX}:{namespace}"
+
+
+def get_cache_version(namespace: str) -> int:
+    # Versions live in the default cache: a bump reaches every worker only when CACHE_URL is a shared
+    # backend (see core.checks); with the locmem default it reaches the current process only.
+    key = get_cache_version_key(namespace)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, 1, timeout=None)
+        version = cache.get(key, 1)
+    return version
+
+
+def bump_cache_version(namespace: str) -> int:
+    key = get_cache_version_key(namespace)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        cache.set(key, 2, timeout=None)
+        return 2
+
+
+def build_cache_key(namespace: str, *parts) -> str:
+    return ":".join([namespace, f"v{get_cache_version(namespace)}", *(str(part) for part in parts)])
+
+
+class VersionedProcessCache:
+    """
+    Per-process store of values produced by `loader(key)`, e.g. one lookup table per language.
+    Each read compares the stored version with the namespace version in the default cache and reloads
+    after a bump (see core.signals). Entries also expire after PROCESS_CACHE_TIMEOUT seconds, which bounds
+    how long a worker serves stale tables when the bump happened in another process and the default
+    cache is not shared.
+    """
+
+    def __init__(self, namespace: str, loader):
+        self.namespace = namespace
+        self.loader = loader
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def _get_fresh(self, key, version):
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == version and entry[1] > time.monotonic():
+            return entry
+        return None
+
+    def get(self, key):
+        version = get_cache_version(self.namespace)
+        entry = self._get_fresh(key, version)
+        if entry is not None:
+            return entry[2]
+
+        with self._lock:
+            entry = self._get_fresh(key, version)
+            if entry is not None:
+                return entry[2]
+            value = self.loader(key)
+            self._entries[key] = (version, time.monotonic() + settings.PROCESS_CACHE_TIMEOUT, value)
+            return value
+
+    def clear(self):
+        self._entries.clear()
@@ -0,0 +1,26 @@
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+
+# Cache backends that keep their data in the current process, so cache version bumps never reach other workers.
+PROCESS_LOCAL_CACHE_BACKENDS = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+
+@register(Tags.caches)
+def check_shared_default_cache(app_configs, **kwargs):
+    if settings.DEBUG or settings.CACHES["default"]["BACKEND"] not in PROCESS_LOCAL_CACHE_BACKENDS:
+        return []
+    return [
+        Warning(
+            "The default cache is local to each process, so cache version bumps from the admin or management "
+            "commands do not reach other workers.",
+            hint=(
+                "Set CACHE_URL to a shared backend (e.g. redis://redis:6379/1). Until then other workers serve "
+                f"stale slug maps, site configuration, assets and pages for up to PROCESS_CACHE_TIMEOUT "
+                f"({settings.PROCESS_CACHE_TIMEOUT}s) and PAGE_CACHE_TIMEOUT ({settings.PAGE_CACHE_TIMEOUT}s)."
+            ),
+            id="core.W001",
+        )
+    ]
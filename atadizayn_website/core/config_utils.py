@@ -0,0 +1,21 @@
+from django.utils.translation import override
+
+from atadizayn_website.core.cache_utils import VersionedProcessCache
+from atadizayn_website.core.models import SiteConfiguration
+from atadizayn_website.core.slug_utils import get_lang_code
+
+SITE_CONFIG_CACHE_NAMESPACE = "site-config"
+
+
+def load_site_configurations(lang_code: str) -> dict:
+    # Read under the language so modeltranslation's fallback fills values missing in that language.
+    with override(lang_code):
+        return {config.key: config.value for config in SiteConfiguration.objects.all()}
+
+
+# Every key for a language in one query; reloaded after any SiteConfiguration save or delete.
+site_configurations = VersionedProcessCache(SITE_CONFIG_CACHE_NAMESPACE, load_site_configurations)
+
+
+def get_site_config(key: str, default=""):
+    return site_configurations.get(get_lang_code()).get(key) or default
@@ -1,13 +1,47 @@
+from django.core.cache import cache
 from django.utils import timezone
+from django.utils.functional import SimpleLazyObject
 
 from atadizayn_website.blog.models import BlogPost
+from atadizayn_website.core.cache_utils import build_cache_key
+from atadizayn_website.core.slug_map_utils import get_language_switch_urls
+from atadizayn_website.core.slug_utils import get_lang_code, get_language_codes
+
+FOOTER_BLOG_CACHE_NAMESPACE = "footer-blog"
+FOOTER_BLOG_CACHE_TIMEOUT = 60 * 60 * 24
+FOOTER_BLOG_COLLECTIONS = ("policy", "corporate")
+
+
+def _build_footer_blog_collections():
+    now = timezone.now()
+    label_fields = [
+        f"{field_name}_{lang_code}" for lang_code in get_language_codes() for field_name in ("title", "slug")
+    ]
+    posts = BlogPost.objects.filter(collection__in=FOOTER_BLOG_COLLECTIONS, status="published")
+
+    posts_by_collection = {collection: [] for collection in FOOTER_BLOG_COLLECTIONS}
+    for post in posts.filter(publish_date__lte=now).only("id", "title", "slug", "collection", *label_fields):
+        posts_by_collection[post.collection].append({"title": post.title, "url": post.get_absolute_url()})
+
+    # Expire when the next scheduled post goes live, so it appears without waiting for a save.
+    timeout = FOOTER_BLOG_CACHE_TIMEOUT
+    next_publish_date = (
+        posts.filter(publish_date__gt=now).order_by("publish_date").values_list("publish_date", flat=True).first()
+    )
+    if next_publish_date:
+        timeout = min(timeout, int((next_publish_date - now).total_seconds()) + 1)
+    return posts_by_collection, timeout
 
 
 def footer_blog_collections(request):
-    published_posts = BlogPost.objects.filter(status="published", publish_date__lte=timezone.now())
+    cache_key = build_cache_key(FOOTER_BLOG_CACHE_NAMESPACE, get_lang_code())
+    posts_by_collection = cache.get(cache_key)
+    if posts_by_collection is None:
+        posts_by_collection, timeout = _build_footer_blog_collections()
+        cache.set(cache_key, posts_by_collection, timeout)
     return {
-        "footer_policy_posts": published_posts.filter(collection="policy"),
-        "footer_corporate_posts": published_posts.filter(collection="corporate"),
+        "footer_policy_posts": posts_by_collection["policy"],
+        "footer_corporate_posts": posts_by_collection["corporate"],
     }
 
 
@@ -15,3 +49,8 @@ def canonical_url(request):
     return {
         "canonical_url": request.build_absolute_uri(request.path),
     }
+
+
+def language_switch_urls(request):
+    # Evaluated on first use, i.e. when the navbar renders the language menu.
+    return {"language_switch_urls": SimpleLazyObject(lambda: get_language_switch_urls(request))}
@@ -0,0 +1,101 @@
+import json
+
+from django.db import connection, transaction
+from django.utils import timezone
+from django.utils.translation import override
+
+from atadizayn_website.blog.models import BlogPost
+from atadizayn_website.core.context_processors import FOOTER_BLOG_COLLECTIONS
+from atadizayn_website.core.slug_utils import get_language_codes
+from atadizayn_website.products.models import Category, CategoryImage, Product, ProductImage, ProductVariant
+
+FULL_SCAN_CANDIDATES = ("Index Scan", "Index Only Scan")
+
+
+def _first_pk(model) -> int:
+    # Plans are built with a real id when there is one; an empty table still gets a valid plan.
+    return model.objects.order_by("pk").values_list("pk", flat=True).first() or 0
+
+
+def get_hot_querysets():
+    """
+    (label, queryset) pairs mirroring the filters and orderings of the request-path querysets in blog.views,
+    core.views, the context processors and products.loaders. Keep in step when those change.
+    """
+    now = timezone.now()
+    published = BlogPost.objects.filter(status="published", publish_date__lte=now)
+    category_pk = _first_pk(Category)
+    product_pk = _first_pk(Product)
+
+    querysets = [
+        ("blog: post index page", published.filter(collection="post").order_by("-publish_date")[:6]),
+        ("blog: announcement index page", published.filter(collection="announcement").order_by("-publish_date")[:6]),
+        (
+            "home: latest post per collection",
+            published.filter(collection__in=["post", "announcement"])
+            .order_by("collection", "-publish_date", "-id")
+            .distinct("collection"),
+        ),
+        ("footer: policy and corporate posts", published.filter(collection__in=FOOTER_BLOG_COLLECTIONS)),
+        (
+            "footer: next scheduled post",
+            BlogPost.objects.filter(collection__in=FOOTER_BLOG_COLLECTIONS, status="published", publish_date__gt=now)
+            .order_by("publish_date")
+            .values_list("publish_date", flat=True)[:1],
+        ),
+        ("product page: product by id", Product.objects.select_related("category").filter(pk=product_pk)),
+        ("product page: variants", ProductVariant.objects.filter(product_id=product_pk)),
+        (
+            "category page: product card images",
+            ProductImage.objects.filter(product_id__in=[product_pk]).order_by("-is_primary", "sort_order", "id"),
+        ),
+        (
+            "collection page: category card images",
+            CategoryImage.objects.filter(category_id__in=[category_pk]).order_by("-is_primary", "sort_order", "id"),
+        ),
+    ]
+    # Name ordering is rewritten to the active language's column, so these are planned once per language.
+    for lang_code in get_language_codes():
+        with override(lang_code):
+            querysets += [
+                (f"collection page ({lang_code}): categories", Category.objects.filter(collection="part")),
+                (f"category page ({lang_code}): products", Product.objects.filter(category_id=category_pk)),
+            ]
+    return querysets
+
+
+def _is_full_scan(plan_node) -> bool:
+    node_type = plan_node.get("Node Type")
+    if node_type == "Seq Scan":
+        return True
+    # An index scan without an Index Cond is fine on its own: index-only scans and ordered scans under a LIMIT
+    # read just the rows they return. Only EXPLAIN ANALYZE shows when its Filter throws most of them away.
+    if node_type not in FULL_SCAN_CANDIDATES or "Index Cond" in plan_node or "Filter" not in plan_node:
+        return False
+    return plan_node.get("Rows Removed by Filter", 0) > plan_node.get("Actual Rows", 0)
+
+
+def find_sequential_scans(plan_node, tables) -> list[str]:
+    """
+    Names of the `tables` an EXPLAIN (FORMAT JSON) plan tree reads in full: Seq Scan nodes, and index scans
+    with no Index Cond whose Filter removes more rows than it keeps (ANALYZE plans only).
+    """
+    relations = []
+    if plan_node.get("Relation Name") in tables and _is_full_scan(plan_node):
+        relations.append(plan_node["Relation Name"])
+    for child in plan_node.get("Plans", []):
+        relations.extend(find_sequential_scans(child, tables))
+    return relations
+
+
+def explain_queryset(queryset, allow_seqscan: bool = False, analyze: bool = False) -> dict:
+    """
+    Returns the top plan node of `queryset`. With allow_seqscan=False the planner is told to avoid sequential
+    scans, so one that still shows up means no index matches, however small the table is today.
+    """
+    with transaction.atomic():
+        if not allow_seqscan:
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+        plan = json.loads(queryset.explain(format="json", analyze=analyze))
+    return plan[0]["Plan"]
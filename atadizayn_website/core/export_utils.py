@@ -0,0 +1,123 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from django.conf import settings
+from django.test import Client
+from django.utils import timezone
+from django.utils.translation import override
+from whitenoise.compress import Compressor
+
+from atadizayn_website.blog.models import BlogPost
+from atadizayn_website.core.context_processors import FOOTER_BLOG_COLLECTIONS
+from atadizayn_website.core.models import SiteAsset, SiteConfiguration
+from atadizayn_website.core.slug_utils import get_translated_field_names
+from atadizayn_website.products.models import Category
+
+EXPORT_MANIFEST_NAME = ".export-manifest.json"
+EXPORT_INDEX_NAME = "index.html"
+EXPORT_COMPRESSED_SUFFIXES = (".gz", ".br")
+
+
+def get_layout_fingerprint() -> str:
+    """
+    Hash of everything the navbar and footer render on every page: category links, footer posts,
+    site configuration and assets. When it changes, every exported page is stale.
+    """
+    link_fields = [*get_translated_field_names("name"), *get_translated_field_names("slug")]
+    footer_post_fields = [*get_translated_field_names("title"), *get_translated_field_names("slug")]
+    rows = [
+        list(Category.objects.order_by("pk").values_list("pk", "collection", *link_fields)),
+        list(
+            BlogPost.objects.filter(
+                collection__in=FOOTER_BLOG_COLLECTIONS,
+                status="published",
+                publish_date__lte=timezone.now(),
+            )
+            .order_by("pk")
+            .values_list("pk", "collection", *footer_post_fields)
+        ),
+        list(SiteConfiguration.objects.order_by("pk").values_list()),
+        list(SiteAsset.objects.order_by("pk").values_list()),
+    ]
+    return hashlib.sha1(repr(rows).encode("utf-8")).hexdigest()
+
+
+def collect_export_pages(sitemaps) -> dict:
+    """
+    Maps every sitemap URL in every language to its fingerprint: the sitemap's lastmod for detail pages,
+    None for pages without one (home, collection and blog indexes), which are rendered on every run.
+    """
+    pages = {}
+    for sitemap_class in sitemaps.values():
+        sitemap = sitemap_class()
+        get_lastmod = getattr(sitemap, "lastmod", None)
+        items = list(sitemap.items())
+        for lang_code, _name in settings.LANGUAGES:
+            with override(lang_code):
+                for item in items:
+                    lastmod = get_lastmod(item) if get_lastmod else None
+                    pages[sitemap.location(item)] = lastmod.isoformat() if lastmod else None
+    return pages
+
+
+def load_export_manifest(output_dir: Path) -> dict:
+    try:
+        with open(output_dir / EXPORT_MANIFEST_NAME, encoding="utf-8") as manifest_file:
+            return json.load(manifest_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_export_manifest(output_dir: Path, manifest: dict) -> None:
+    temporary_path = output_dir / f"{EXPORT_MANIFEST_NAME}.tmp"
+    with open(temporary_path, "w", encoding="utf-8") as manifest_file:
+        json.dump(manifest, manifest_file, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(temporary_path, output_dir / EXPORT_MANIFEST_NAME)
+
+
+def get_export_file_path(output_dir: Path, url_path: str) -> Path:
+    # /tr/baglanti-parcalari/ -> <output>/tr/baglanti-parcalari/index.html, the layout try_files expects.
+    return output_dir.joinpath(*[part for part in url_path.split("/") if part], EXPORT_INDEX_NAME)
+
+
+def remove_exported_page(output_dir: Path, url_path: str) -> None:
+    file_path = get_export_file_path(output_dir, url_path)
+    for suffix in ("", *EXPORT_COMPRESSED_SUFFIXES):
+        Path(f"{file_path}{suffix}").unlink(missing_ok=True)
+    try:
+        file_path.parent.rmdir()
+    except OSError:
+        pass
+
+
+def export_pages(output_dir: Path, host: str, secure: bool, url_paths) -> list:
+    """
+    Renders `url_paths` through the regular URLconf and writes index.html plus .gz and .br siblings.
+    Returns (url_path, status_code) pairs; only 200 responses are written. Runs inside pool workers.
+    """
+    client = Client(HTTP_HOST=host)
+    compressor = Compressor(quiet=True)
+    results = []
+    for url_path in url_paths:
+        response = client.get(url_path, secure=secure)
+        if response.status_code == 200:
+            file_path = get_export_file_path(output_dir, url_path)
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename, so the proxy never serves a half-written file.
+            temporary_path = file_path.with_name(f".{EXPORT_INDEX_NAME}.tmp")
+            temporary_path.write_bytes(response.content)
+            os.replace(temporary_path, file_path)
+            for suffix in EXPORT_COMPRESSED_SUFFIXES:
+                Path(f"{file_path}{suffix}").unlink(missing_ok=True)
+            compressor.compress(str(file_path))
+        results.append((url_path, response.status_code))
+    return results
+
+
+def init_export_worker() -> None:
+    # Spawned (non-forked) workers start with an unconfigured Django.
+    import django
+
+    django.setup()
@@ -0,0 +1,127 @@
+import logging
+import os
+from contextlib import contextmanager
+from functools import partial
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import transaction
+from django.dispatch import Signal
+from PIL import Image, ImageOps, UnidentifiedImageError, features
+
+logger = logging.getLogger(__name__)
+
+# Sent with `instance` once new derivatives are stored, so the pages showing the image can be evicted.
+image_derivatives_replaced = Signal()
+
+# Pillow format name, MIME type and encoder options per derivative format, best compression first.
+RESPONSIVE_IMAGE_ENCODINGS = {
+    "avif": ("AVIF", "image/avif", {"quality": 60}),
+    "webp": ("WEBP", "image/webp", {"quality": 80, "method": 4}),
+}
+RESPONSIVE_IMAGE_DIR = "responsive"
+
+
+def get_responsive_image_formats() -> list[str]:
+    # AVIF needs a Pillow built with libavif (bundled in wheels since 11.3); formats it cannot write are skipped.
+    return [
+        format_name
+        for format_name in settings.RESPONSIVE_IMAGE_FORMATS
+        if format_name in RESPONSIVE_IMAGE_ENCODINGS and features.check(format_name)
+    ]
+
+
+def get_derivative_widths(original_width: int) -> list[int]:
+    # Configured widths below the original, plus the original (capped) so small images are still re-encoded.
+    widths = [width for width in settings.RESPONSIVE_IMAGE_WIDTHS if width < original_width]
+    widths.append(min(original_width, max(settings.RESPONSIVE_IMAGE_WIDTHS)))
+    return sorted(set(widths))
+
+
+def _encode_derivatives(instance, field_file, image, sources: dict) -> None:
+    # Fills `sources` as files are saved, so a failure part way still knows what to delete.
+    stem = os.path.splitext(os.path.basename(field_file.name))[0]
+    for format_name in get_responsive_image_formats():
+        pillow_format, _mime_type, options = RESPONSIVE_IMAGE_ENCODINGS[format_name]
+        sources[format_name] = []
+        for width in get_derivative_widths(image.width):
+            height = max(1, round(image.height * width / image.width))
+            resized = image if width == image.width else image.resize((width, height), Image.Resampling.LANCZOS)
+            buffer = BytesIO()
+            resized.save(buffer, pillow_format, **options)
+            name = field_file.field.generate_filename(instance, f"{RESPONSIVE_IMAGE_DIR}/{stem}-{width}w.{format_name}")
+            name = field_file.storage.save(name, ContentFile(buffer.getvalue()))
+            sources[format_name].append([width, height, name])
+
+
+def generate_image_derivatives(instance, field_file) -> dict:
+    """
+    Encodes the stored `field_file` at the configured widths in every supported format and saves the files
+    next to the upload (`<upload_to>/responsive/`). Returns the metadata stored on the model:
+    {"width", "height", "sources": {format: [[width, height, storage name], ...]}}, or {} for files Pillow
+    cannot read (SVG, video) or fails on, e.g. decompression bombs; the original image is served then.
+    """
+    try:
+        field_file.open("rb")
+        with Image.open(field_file) as source:
+            image = ImageOps.exif_transpose(source)
+            image = image.convert("RGBA" if "A" in image.getbands() or "transparency" in image.info else "RGB")
+    except UnidentifiedImageError:
+        return {}
+    except (OSError, ValueError, Image.DecompressionBombError):
+        logger.warning("Could not read %s for responsive derivatives.", field_file.name, exc_info=True)
+        return {}
+    finally:
+        field_file.close()
+
+    variants = {"width": image.width, "height": image.height, "sources": {}}
+    try:
+        _encode_derivatives(instance, field_file, image, variants["sources"])
+    except Exception:
+        # Encoder (e.g. libavif) or storage failures must not fail the request; files written so far are removed.
+        logger.warning("Could not encode responsive derivatives of %s.", field_file.name, exc_info=True)
+        delete_image_derivatives(field_file.storage, variants)
+        return {}
+    return variants
+
+
+def delete_image_derivatives(storage, variants: dict) -> None:
+    for derivatives in (variants or {}).get("sources", {}).values():
+        for _width, _height, name in derivatives:
+            storage.delete(name)
+
+
+def _replace_image_derivatives(instance, field_name: str, variants_field: str, previous_variants: dict) -> None:
+    field_file = getattr(instance, field_name)
+    delete_image_derivatives(field_file.storage, previous_variants)
+    variants = generate_image_derivatives(instance, field_file) if field_file else {}
+    if variants:
+        setattr(instance, variants_field, variants)
+        # update() skips save() and its signals (search vectors, counts, updated_at); only the pages need evicting.
+        type(instance).objects.filter(pk=instance.pk).update(**{variants_field: variants})
+        image_derivatives_replaced.send(sender=type(instance), instance=instance)
+
+
+@contextmanager
+def image_derivatives_on_commit(instance, field_name: str, variants_field: str):
+    """
+    Wraps super().save() in the model's save(). A fresh upload or a cleared field is saved with empty
+    variants; once the transaction commits, the previous derivatives are deleted and new ones are generated
+    from the stored file, so a failed or rolled-back save leaves no files behind. An unchanged file keeps them.
+    """
+    field_file = getattr(instance, field_name)
+    if field_file and field_file._committed:
+        yield
+        return
+
+    previous_variants = getattr(instance, variants_field) or {}
+    setattr(instance, variants_field, {})
+    yield
+    transaction.on_commit(
+        partial(_replace_image_derivatives, instance, field_name, variants_field, previous_variants), robust=True
+    )
+
+
+def build_srcset(storage, derivatives) -> str:
+    return ", ".join(f"{storage.url(name)} {width}w" for width, _height, name in derivatives)
@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand
+
+from atadizayn_website.blog.models import BlogPost
+from atadizayn_website.core.search_utils import update_search_vectors
+from atadizayn_website.core.text_utils import sync_plain_text_fields
+from atadizayn_website.products.models import Category, Product
+
+PLAIN_TEXT_MODELS = (Category, Product, BlogPost)
+
+
+class Command(BaseCommand):
+    help = "Regenerates the per-language plain-text columns derived from CKEditor HTML, in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=200,
+            help="Number of rows loaded and written per batch.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options["batch_size"])
+
+        for model in PLAIN_TEXT_MODELS:
+            queryset = model.objects.order_by("pk")
+            updated = 0
+            batch = []
+            update_fields = []
+            for instance in queryset.iterator(chunk_size=batch_size):
+                update_fields = []
+                for source_field, target_field in model.PLAIN_TEXT_FIELDS.items():
+                    update_fields += sync_plain_text_fields(instance, source_field, target_field)
+                batch.append(instance)
+                if len(batch) >= batch_size:
+                    updated += self._write_batch(model, batch, update_fields)
+                    batch = []
+
+            if batch:
+                updated += self._write_batch(model, batch, update_fields)
+
+            self.stdout.write(self.style.SUCCESS(f"{model._meta.verbose_name_plural}: {updated} kayıt güncellendi."))
+
+    @staticmethod
+    def _write_batch(model, batch, update_fields) -> int:
+        model.objects.bulk_update(batch, update_fields)
+        # The search vectors index the plain-text columns, so they follow the backfill.
+        update_search_vectors(model.objects.filter(pk__in=[instance.pk for instance in batch]), model.SEARCH_FIELDS)
+        return len(batch)
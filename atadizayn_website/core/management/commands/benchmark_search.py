@@ -0,0 +1,118 @@
+import json
+import time
+
+from django.core.cache import caches
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, setup_test_environment, teardown_test_environment
+
+from atadizayn_website.core.benchmark_utils import BENCHMARK_QUERIES, seed_benchmark_catalog, summarize_samples
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmarks global_search against synthetic Turkish/English catalogs of several sizes and reports "
+        "p50/p95/p99 latency and query counts. Seeded rows are rolled back after each size."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            default="100,1000",
+            help="Comma separated product counts to benchmark, e.g. 100,1000,10000.",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=10,
+            help="Requests per query and catalog size.",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Random seed for the synthetic catalog.",
+        )
+        parser.add_argument(
+            "--cached",
+            action="store_true",
+            help="Keep the search result cache between requests instead of measuring the uncached path.",
+        )
+        parser.add_argument(
+            "--json",
+            dest="json_path",
+            help="Also write the results to this file as JSON, for comparing runs.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            sizes = [int(size) for size in options["sizes"].split(",") if size.strip()]
+        except ValueError as exc:
+            raise CommandError("--sizes must be a comma separated list of integers.") from exc
+        if not sizes or min(sizes) < 1:
+            raise CommandError("--sizes must contain positive integers.")
+
+        repeat = max(1, options["repeat"])
+        results = []
+
+        # Lets the test client reach the site regardless of ALLOWED_HOSTS.
+        setup_test_environment()
+        try:
+            for size in sizes:
+                results.extend(self._benchmark_size(size, repeat, options["seed"], options["cached"]))
+        finally:
+            teardown_test_environment()
+
+        if options["json_path"]:
+            with open(options["json_path"], "w", encoding="utf-8") as output:
+                json.dump(results, output, ensure_ascii=False, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"Sonuçlar {options['json_path']} dosyasına yazıldı."))
+
+    def _benchmark_size(self, size, repeat, seed, cached):
+        results = []
+        search_cache = caches["search"]
+        client = Client()
+
+        with transaction.atomic():
+            started = time.perf_counter()
+            counts = seed_benchmark_catalog(size, seed=seed)
+            seed_seconds = time.perf_counter() - started
+            self.stdout.write(
+                f"\nKatalog: {counts['categories']} kategori, {counts['products']} ürün, "
+                f"{counts['variants']} varyant, {counts['posts']} yazı ({seed_seconds:.1f} sn)"
+            )
+            self.stdout.write(
+                f"{'dil':<4}{'sorgu':<18}{'sonuç':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'SQL':>6}"
+            )
+
+            search_cache.clear()
+            for lang_code, query in BENCHMARK_QUERIES:
+                url = f"/{lang_code}/search/"
+                durations = []
+                query_counts = []
+                # One warm-up request so template loading and the first connection setup are not measured.
+                client.get(url, {"q": query})
+                for _index in range(repeat):
+                    if not cached:
+                        search_cache.clear()
+                    with CaptureQueriesContext(connection) as captured:
+                        started = time.perf_counter()
+                        response = client.get(url, {"q": query})
+                        durations.append(time.perf_counter() - started)
+                    query_counts.append(len(captured))
+
+                if response.status_code != 200:
+                    raise CommandError(f"{url}?q={query} returned {response.status_code}.")
+
+                summary = summarize_samples(durations, query_counts)
+                result_count = response.context["page_obj"].paginator.count
+                results.append({"size": size, "lang": lang_code, "query": query, "results": result_count, **summary})
+                self.stdout.write(
+                    f"{lang_code:<4}{query:<18}{result_count:>7}{summary['p50_ms']:>10.1f}"
+                    f"{summary['p95_ms']:>10.1f}{summary['p99_ms']:>10.1f}{summary['queries']:>6}"
+                )
+
+            transaction.set_rollback(True)
+
+        return results
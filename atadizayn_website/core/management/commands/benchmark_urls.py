@@ -0,0 +1,94 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, reset_queries, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils.translation import override
+
+from atadizayn_website.core.benchmark_utils import seed_benchmark_catalog, summarize_samples
+from atadizayn_website.core.slug_utils import get_language_codes, get_translated_slug
+from atadizayn_website.core.url_utils import build_urls, get_translated_urls
+from atadizayn_website.products.models import Product
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmarks building every product URL in every language with get_absolute_url() against the bulk "
+        "builders in core.url_utils on a synthetic catalog that is rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--size",
+            type=int,
+            default=10000,
+            help="Synthetic products to build URLs for.",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Runs per method.",
+        )
+
+    def handle(self, *args, **options):
+        if options["size"] < 1:
+            raise CommandError("--size must be a positive integer.")
+        repeat = max(1, options["repeat"])
+
+        with transaction.atomic():
+            counts = seed_benchmark_catalog(options["size"])
+            self.stdout.write(f"Katalog: {counts['products']} ürün, {len(get_language_codes())} dil")
+
+            products = list(Product.objects.select_related("category"))
+            slug_rows = {}
+            for lang_code in get_language_codes():
+                with override(lang_code):
+                    slug_rows[lang_code] = [
+                        (get_translated_slug(product.category), get_translated_slug(product)) for product in products
+                    ]
+
+            methods = {
+                "get_absolute_url (loaded rows)": lambda lang_code: [
+                    product.get_absolute_url() for product in products
+                ],
+                "build_urls (slug tuples)": lambda lang_code: build_urls(
+                    "product-detail", slug_rows[lang_code], lang_code
+                ),
+                "get_absolute_url + query": lambda lang_code: [
+                    product.get_absolute_url() for product in Product.objects.select_related("category")
+                ],
+                "get_translated_urls + query": lambda lang_code: list(
+                    get_translated_urls(Product.objects.all(), lang_code).values()
+                ),
+            }
+
+            self.stdout.write(f"{'yöntem':<32}{'p50 ms':>10}{'p95 ms':>10}{'SQL':>6}")
+            outputs = {}
+            for label, method in methods.items():
+                durations = []
+                query_counts = []
+                for _index in range(repeat):
+                    # Seeding overflows the capped query log, which would make every capture count zero.
+                    reset_queries()
+                    with CaptureQueriesContext(connection) as captured:
+                        started = time.perf_counter()
+                        urls = []
+                        for lang_code in get_language_codes():
+                            with override(lang_code):
+                                urls.extend(method(lang_code))
+                        durations.append(time.perf_counter() - started)
+                    query_counts.append(len(captured))
+                outputs[label] = sorted(urls)
+                summary = summarize_samples(durations, query_counts)
+                self.stdout.write(
+                    f"{label:<32}{summary['p50_ms']:>10.1f}{summary['p95_ms']:>10.1f}{summary['queries']:>6}"
+                )
+
+            transaction.set_rollback(True)
+
+        reference = next(iter(outputs.values()))
+        mismatched = [label for label, urls in outputs.items() if urls != reference]
+        if mismatched:
+            raise CommandError(f"URL'ler get_absolute_url ile eşleşmiyor: {', '.join(mismatched)}")
+        self.stdout.write(self.style.SUCCESS(f"Tüm yöntemler aynı {len(reference)} URL'yi üretti."))
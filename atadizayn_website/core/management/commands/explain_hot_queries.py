@@ -0,0 +1,68 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from atadizayn_website.core.benchmark_utils import seed_benchmark_catalog
+from atadizayn_website.core.explain_utils import explain_queryset, find_sequential_scans, get_hot_querysets
+
+
+class Command(BaseCommand):
+    help = (
+        "Runs EXPLAIN on the querysets of the hot request paths and flags sequential scans. "
+        "Sequential scans are discouraged during planning, so a flagged query has no usable index."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--allow-seqscan",
+            action="store_true",
+            help="Plan with default settings instead of discouraging sequential scans (shows the plan used today).",
+        )
+        parser.add_argument(
+            "--analyze",
+            action="store_true",
+            help=(
+                "Use EXPLAIN ANALYZE and report actual execution times; also flags index scans whose filter "
+                "discards most of the rows they read."
+            ),
+        )
+        parser.add_argument(
+            "--catalog-size",
+            type=int,
+            default=0,
+            help=(
+                "Plan against this many synthetic products (rolled back afterwards) instead of the current rows; "
+                "tiny development tables give the planner unrealistic statistics."
+            ),
+        )
+        parser.add_argument(
+            "--verbose-plans",
+            action="store_true",
+            help="Print the full plan tree of every query.",
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            if options["catalog_size"] > 0:
+                seed_benchmark_catalog(options["catalog_size"])
+            flagged = self._explain_all(options)
+            transaction.set_rollback(True)
+
+        if flagged and not options["allow_seqscan"]:
+            raise CommandError(f"{flagged} sorgu indeks kullanmadan tabloyu tarıyor.")
+
+    def _explain_all(self, options):
+        flagged = 0
+        for label, queryset in get_hot_querysets():
+            plan = explain_queryset(queryset, allow_seqscan=options["allow_seqscan"], analyze=options["analyze"])
+            sequential_scans = find_sequential_scans(plan, {queryset.model._meta.db_table})
+            timing = f", {plan['Actual Total Time']:.2f} ms" if options["analyze"] else ""
+            summary = f"{label}: {plan['Node Type']} (cost {plan['Total Cost']:.1f}{timing})"
+
+            if sequential_scans:
+                flagged += 1
+                self.stdout.write(self.style.WARNING(f"{summary} -- Seq Scan: {', '.join(sequential_scans)}"))
+            else:
+                self.stdout.write(self.style.SUCCESS(summary))
+            if options["verbose_plans"]:
+                self.stdout.write(queryset.explain())
+        return flagged
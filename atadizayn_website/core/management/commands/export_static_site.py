@@ -0,0 +1,115 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from atadizayn_website.core.export_utils import (
+    collect_export_pages,
+    export_pages,
+    get_layout_fingerprint,
+    init_export_worker,
+    load_export_manifest,
+    remove_exported_page,
+    save_export_manifest,
+)
+from config.urls import sitemaps
+
+
+class Command(BaseCommand):
+    help = (
+        "Pre-renders every sitemap URL in every language to index.html files with .gz and .br siblings "
+        "for a front proxy to serve. Only pages whose rows changed since the last run are rendered again."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            default=str(settings.STATIC_EXPORT_ROOT),
+            help="Directory to write the exported pages to.",
+        )
+        parser.add_argument(
+            "--host",
+            help="Host name the pages are rendered for (canonical URLs). Defaults to the current Site's domain.",
+        )
+        parser.add_argument(
+            "--scheme",
+            choices=("http", "https"),
+            default="https",
+            help="Scheme the pages are rendered for.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Rendering processes; 1 renders in this process.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=50,
+            help="Pages handed to a worker at a time.",
+        )
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Ignore the manifest of the previous run and render every page.",
+        )
+
+    def handle(self, *args, **options):
+        output_dir = Path(options["output"])
+        output_dir.mkdir(parents=True, exist_ok=True)
+        host = options["host"] or Site.objects.get_current().domain
+        workers = max(1, options["workers"])
+        batch_size = max(1, options["batch_size"])
+        started = time.perf_counter()
+
+        manifest = {} if options["full"] else load_export_manifest(output_dir)
+        layout = get_layout_fingerprint()
+        previous_pages = manifest.get("pages", {}) if manifest.get("layout") == layout else {}
+        pages = collect_export_pages(sitemaps)
+
+        # Pages without a lastmod fingerprint (home and index pages) aggregate many rows and are always rendered.
+        stale_paths = [
+            url_path
+            for url_path, fingerprint in pages.items()
+            if fingerprint is None or previous_pages.get(url_path) != fingerprint
+        ]
+        removed_paths = set(manifest.get("pages", {})) - set(pages)
+        for url_path in removed_paths:
+            remove_exported_page(output_dir, url_path)
+
+        render = partial(export_pages, output_dir, host, options["scheme"] == "https")
+        batches = [stale_paths[start : start + batch_size] for start in range(0, len(stale_paths), batch_size)]
+        if workers == 1:
+            results = [result for batch in batches for result in render(batch)]
+        else:
+            # Forked workers must not share the parent's database sockets.
+            connections.close_all()
+            with ProcessPoolExecutor(max_workers=workers, initializer=init_export_worker) as executor:
+                results = [result for batch_results in executor.map(render, batches) for result in batch_results]
+
+        exported_pages = {url_path: previous_pages[url_path] for url_path in pages if url_path in previous_pages}
+        failed = 0
+        for url_path, status_code in results:
+            if status_code == 200:
+                exported_pages[url_path] = pages[url_path]
+            else:
+                failed += 1
+                exported_pages.pop(url_path, None)
+                self.stderr.write(self.style.WARNING(f"{url_path}: HTTP {status_code}, atlandı."))
+        save_export_manifest(output_dir, {"layout": layout, "pages": exported_pages})
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Sayfalar: {len(results) - failed} oluşturuldu, {len(pages) - len(stale_paths)} güncel, "
+                f"{len(removed_paths)} silindi, {failed} hatalı ({time.perf_counter() - started:.1f} sn)."
+            )
+        )
+        if results and failed == len(results):
+            raise CommandError("Hiçbir sayfa oluşturulamadı.")
@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand
+
+from atadizayn_website.blog.models import BlogPost
+from atadizayn_website.core.image_utils import delete_image_derivatives, generate_image_derivatives
+from atadizayn_website.core.models import BrandCarouselImage
+from atadizayn_website.core.page_cache_utils import flush_page_cache
+from atadizayn_website.products.models import CategoryImage, ProductImage
+
+# (model, image field, derivative metadata field) of every image rendered with {% responsive_image %}.
+RESPONSIVE_IMAGE_FIELDS = (
+    (ProductImage, "image", "image_variants"),
+    (CategoryImage, "image", "image_variants"),
+    (BlogPost, "cover_image", "cover_image_variants"),
+    (BrandCarouselImage, "image", "image_variants"),
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Generates the WebP/AVIF width derivatives of stored images that have none, e.g. uploads from before "
+        "the image pipeline. New uploads get them on save."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Regenerate every image, e.g. after changing RESPONSIVE_IMAGE_WIDTHS or RESPONSIVE_IMAGE_FORMATS.",
+        )
+
+    def handle(self, *args, **options):
+        for model, field_name, variants_field in RESPONSIVE_IMAGE_FIELDS:
+            queryset = model.objects.exclude(**{field_name: ""}).exclude(**{f"{field_name}__isnull": True})
+            if not options["force"]:
+                queryset = queryset.filter(**{variants_field: {}})
+
+            updated = 0
+            for instance in queryset.only("pk", field_name, variants_field).iterator(chunk_size=100):
+                field_file = getattr(instance, field_name)
+                delete_image_derivatives(field_file.storage, getattr(instance, variants_field))
+                variants = generate_image_derivatives(instance, field_file)
+                # update() skips save() and its signals; the page cache is flushed once at the end instead.
+                model.objects.filter(pk=instance.pk).update(**{variants_field: variants})
+                updated += 1
+
+            self.stdout.write(self.style.SUCCESS(f"{model._meta.verbose_name_plural}: {updated} kayıt güncellendi."))
+
+        flush_page_cache()
@@ -0,0 +1,96 @@
+import hashlib
+
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.core.management.base import BaseCommand
+
+from atadizayn_website.core.sitemap_utils import (
+    delete_sitemap_file,
+    get_chunk_fingerprint,
+    get_sitemap_file_name,
+    get_sitemap_url_fingerprint,
+    load_sitemap_manifest,
+    paginate_sitemap,
+    render_sitemap_chunk,
+    render_sitemap_index,
+    save_sitemap_manifest,
+    write_sitemap_file,
+)
+from config.urls import sitemaps
+
+
+class Command(BaseCommand):
+    help = (
+        "Writes the sitemap index and fixed-size sitemap files (with .gz siblings) to the default storage. "
+        "Only files whose items or lastmod changed since the last run are rendered again."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--host",
+            help="Host name used in sitemap URLs. Defaults to the current Site's domain.",
+        )
+        parser.add_argument(
+            "--scheme",
+            choices=("http", "https"),
+            default="https",
+            help="Scheme used in sitemap URLs.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=settings.SITEMAP_CHUNK_SIZE,
+            help="URLs per sitemap file (each language counts).",
+        )
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Ignore the manifest of the previous run and render every file.",
+        )
+
+    def handle(self, *args, **options):
+        host = options["host"] or Site.objects.get_current().domain
+        site = Site(domain=host, name=host)
+        protocol = options["scheme"]
+        chunk_size = max(1, options["chunk_size"])
+
+        manifest = {} if options["full"] else load_sitemap_manifest()
+        settings_key = [f"{protocol}://{host}", chunk_size, get_sitemap_url_fingerprint()]
+        previous_chunks = manifest.get("chunks", {}) if manifest.get("settings") == settings_key else {}
+
+        chunks = {}
+        index_entries = []
+        rendered = 0
+        for section, sitemap_class in sitemaps.items():
+            sitemap, paginator = paginate_sitemap(sitemap_class, chunk_size)
+            if not paginator.count:
+                continue
+            for page in paginator.page_range:
+                name = get_sitemap_file_name(section, page)
+                fingerprint = get_chunk_fingerprint(sitemap, paginator.page(page).object_list)
+                chunk = previous_chunks.get(name)
+                if chunk is None or chunk["fingerprint"] != fingerprint:
+                    content, lastmod = render_sitemap_chunk(sitemap, page, site, protocol)
+                    write_sitemap_file(name, content)
+                    chunk = {"fingerprint": fingerprint, "lastmod": lastmod.isoformat() if lastmod else None}
+                    rendered += 1
+                chunks[name] = chunk
+                index_entries.append((section, page, chunk["lastmod"]))
+
+        removed_names = set(manifest.get("chunks", {})) - set(chunks)
+        for name in removed_names:
+            delete_sitemap_file(name)
+
+        # The index is rewritten only when it changes, so its Last-Modified stays put between quiet runs.
+        index_content = render_sitemap_index(index_entries, host, protocol)
+        index_fingerprint = hashlib.sha1(index_content.encode("utf-8")).hexdigest()
+        if index_fingerprint != manifest.get("index"):
+            write_sitemap_file(get_sitemap_file_name(), index_content)
+        save_sitemap_manifest({"settings": settings_key, "index": index_fingerprint, "chunks": chunks})
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Site haritası: {rendered} dosya oluşturuldu, {len(chunks) - rendered} güncel, "
+                f"{len(removed_names)} silindi."
+            )
+        )
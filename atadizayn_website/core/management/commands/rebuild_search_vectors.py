@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from atadizayn_website.blog.models import BlogPost
+from atadizayn_website.core.search_utils import update_search_vectors
+from atadizayn_website.products.models import Category, Product
+
+SEARCHABLE_MODELS = (Category, Product, BlogPost)
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the per-language full-text search vectors of categories, products and blog posts."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of rows updated per UPDATE statement.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options["batch_size"])
+
+        for model in SEARCHABLE_MODELS:
+            pks = list(model.objects.order_by("pk").values_list("pk", flat=True))
+            updated = 0
+            for start in range(0, len(pks), batch_size):
+                batch = pks[start : start + batch_size]
+                updated += update_search_vectors(model.objects.filter(pk__in=batch), model.SEARCH_FIELDS)
+
+            self.stdout.write(self.style.SUCCESS(f"{model._meta.verbose_name_plural}: {updated} kayıt güncellendi."))
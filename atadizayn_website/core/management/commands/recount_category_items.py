@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from atadizayn_website.products.counters import recount_categories
+from atadizayn_website.products.models import Category
+
+
+class Command(BaseCommand):
+    help = "Recomputes the denormalized product and variant counts of every category."
+
+    def handle(self, *args, **options):
+        updated = recount_categories()
+        self.stdout.write(self.style.SUCCESS(f"{Category._meta.verbose_name_plural}: {updated} kayıt güncellendi."))
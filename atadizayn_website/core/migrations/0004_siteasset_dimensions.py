@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-17 22:10
+
+from django.core.files.images import get_image_dimensions
+from django.db import migrations, models
+
+
+def fill_asset_dimensions(apps, schema_editor):
+    SiteAsset = apps.get_model("core", "SiteAsset")
+    for asset in SiteAsset.objects.exclude(file="").exclude(file__isnull=True):
+        try:
+            width, height = get_image_dimensions(asset.file)
+        except (OSError, ValueError):
+            # Missing or unreadable files are left unmeasured; they get dimensions on the next upload.
+            continue
+        if width and height:
+            SiteAsset.objects.filter(pk=asset.pk).update(width=width, height=height)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_alter_brandcarouselimage_image_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='siteasset',
+            name='height',
+            field=models.PositiveIntegerField(blank=True, editable=False, help_text='Görsel yüksekliği (piksel), yüklemede otomatik hesaplanır', null=True),
+        ),
+        migrations.AddField(
+            model_name='siteasset',
+            name='width',
+            field=models.PositiveIntegerField(blank=True, editable=False, help_text='Görsel genişliği (piksel), yüklemede otomatik hesaplanır', null=True),
+        ),
+        migrations.RunPython(fill_asset_dimensions, migrations.RunPython.noop),
+    ]
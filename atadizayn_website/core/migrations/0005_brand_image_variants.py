@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 22:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_siteasset_dimensions'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='brandcarouselimage',
+            name='image_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False, help_text='Yüklemede üretilen WebP/AVIF genişlikleri'),
+        ),
+    ]
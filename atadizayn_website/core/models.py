@@ -1,6 +1,9 @@
+from django.core.files.images import get_image_dimensions
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
+from atadizayn_website.core.image_utils import image_derivatives_on_commit
+
 
 class BrandCarouselImage(models.Model):
     """Model for brand logos in the homepage carousel"""
@@ -25,6 +28,12 @@ class BrandCarouselImage(models.Model):
         default=True,
         help_text=_("Bu markayı kaydırıcıda göster/gizle"),
     )
+    image_variants = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        help_text=_("Yüklemede üretilen WebP/AVIF genişlikleri"),
+    )
 
     class Meta:
         verbose_name = _("Marka Şerit Görseli")
@@ -33,6 +42,11 @@ class BrandCarouselImage(models.Model):
     def __str__(self):
         return self.alt_text
 
+    def save(self, *args, **kwargs):
+        # SVG logos cannot be rasterized by Pillow and keep no derivatives.
+        with image_derivatives_on_commit(self, "image", "image_variants"):
+            super().save(*args, **kwargs)
+
 
 class SiteAsset(models.Model):
     """Model for managing site-wide assets identifiable by a unique key"""
@@ -54,6 +68,18 @@ class SiteAsset(models.Model):
         null=True,
         help_text=_("Bu varlığın nerede kullanıldığına dair dahili not"),
     )
+    width = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text=_("Görsel genişliği (piksel), yüklemede otomatik hesaplanır"),
+    )
+    height = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text=_("Görsel yüksekliği (piksel), yüklemede otomatik hesaplanır"),
+    )
 
     class Meta:
         verbose_name = _("Site Varlığı")
@@ -62,6 +88,17 @@ class SiteAsset(models.Model):
     def __str__(self):
         return self.key
 
+    def save(self, *args, **kwargs):
+        if not self.file:
+            self.width = self.height = None
+        elif not self.file._committed:
+            # Only a fresh upload is measured; Pillow cannot read videos or SVGs and yields (None, None).
+            try:
+                self.width, self.height = get_image_dimensions(self.file)
+            except (OSError, ValueError):
+                self.width = self.height = None
+        super().save(*args, **kwargs)
+
 
 class SiteConfiguration(models.Model):
     """Model for general key-value site configurations"""
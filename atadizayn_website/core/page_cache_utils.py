@@ -0,0 +1,185 @@
+import copy
+import hashlib
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse, HttpResponseNotFound, QueryDict
+from django.template.loader import render_to_string
+from django.urls import reverse
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.translation import override
+
+from atadizayn_website.core.cache_utils import build_cache_key, bump_cache_version, get_cache_version
+from atadizayn_website.core.slug_utils import get_lang_code, get_language_codes
+
+PAGE_CACHE_NAMESPACE = "page"
+PAGE_CACHE_QUERY_PARAMS = {"page"}
+NOT_FOUND_TEMPLATE_NAME = "404.html"
+
+
+def _get_path_hash(path: str) -> str:
+    return hashlib.sha1(path.encode("utf-8")).hexdigest()
+
+
+def _get_path_namespace(path_hash: str) -> str:
+    return f"{PAGE_CACHE_NAMESPACE}:{path_hash}"
+
+
+def get_page_cache_key(origin: str, path: str, lang_code: str, page_number) -> str:
+    # Two versions: the global one flushes every page, the per-path one evicts a single URL (all its pages).
+    # The origin is part of the key because pages embed absolute canonical URLs.
+    path_hash = _get_path_hash(path)
+    path_version = get_cache_version(_get_path_namespace(path_hash))
+    return build_cache_key(
+        PAGE_CACHE_NAMESPACE, _get_path_hash(origin), lang_code, path_hash, f"v{path_version}", page_number or 1
+    )
+
+
+def get_request_page_cache_key(request) -> str | None:
+    """Cache key for an anonymous GET of a cacheable URL, or None when the response must be rendered."""
+    if settings.PAGE_CACHE_TIMEOUT <= 0 or request.method not in ("GET", "HEAD"):
+        return None
+    if request.user.is_authenticated or not set(request.GET) <= PAGE_CACHE_QUERY_PARAMS:
+        return None
+
+    page_number = request.GET.get("page")
+    if page_number is not None and not page_number.isdigit():
+        return None
+    return get_page_cache_key(request.build_absolute_uri("/"), request.path, get_lang_code(), page_number)
+
+
+def _is_shareable_response(request, response) -> bool:
+    """
+    Whether a rendered response can be served to other visitors. CsrfViewMiddleware and SessionMiddleware
+    add their cookies after the view returns, so `response.cookies` cannot show them yet; the request records
+    that they will: a {% csrf_token %} sets CSRF_COOKIE_NEEDS_UPDATE, a session write marks it modified.
+    """
+    if response.status_code != 200 or response.streaming or response.cookies:
+        return False
+    if request.META.get("CSRF_COOKIE_NEEDS_UPDATE"):
+        return False
+    session = getattr(request, "session", None)
+    return not (session is not None and session.modified)
+
+
+def cache_anonymous_page(view_func):
+    """
+    Serves anonymous visitors from the shared default cache, keyed by language, path and `page`.
+    Staff see edit links and are never cached; pages are evicted by the handlers in core.signals.
+    """
+
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        cache_key = get_request_page_cache_key(request)
+        if cache_key is None:
+            return view_func(request, *args, **kwargs)
+
+        cached = cache.get(cache_key)
+        if cached is not None:
+            content, headers = cached
+            return HttpResponse(content, headers=headers)
+
+        response = view_func(request, *args, **kwargs)
+        if hasattr(response, "render") and callable(response.render):
+            response.render()
+        if _is_shareable_response(request, response):
+            # Headers the view set (Content-Type, Content-Language, Vary, cache headers...) are replayed on hits.
+            headers = {name: value for name, value in response.headers.items() if name.lower() != "content-length"}
+            cache.set(cache_key, (response.content, headers), settings.PAGE_CACHE_TIMEOUT)
+        return response
+
+    return wrapper
+
+
+def get_localized_paths(get_path) -> list[str]:
+    """Calls `get_path()` once per configured language, e.g. `get_localized_paths(product.get_absolute_url)`."""
+    paths = []
+    for lang_code in get_language_codes():
+        with override(lang_code):
+            paths.append(get_path())
+    return paths
+
+
+def get_collection_index_paths(collection: str | None) -> list[str]:
+    if collection not in ("part", "stand"):
+        return []
+    return get_localized_paths(lambda: reverse(f"{collection}_index"))
+
+
+def evict_page_paths(paths) -> None:
+    for path in set(paths):
+        bump_cache_version(_get_path_namespace(_get_path_hash(path)))
+
+
+def flush_page_cache() -> None:
+    bump_cache_version(PAGE_CACHE_NAMESPACE)
+
+
+def conditional_page(get_last_modified):
+    """
+    Answers conditional GETs with 304 before the view renders anything.
+    `get_last_modified(request, *args, **kwargs)` returns the page's newest updated_at, or None to skip.
+    The ETag also carries the language, the page cache version (navbar, footer and other site-wide content)
+    and whether the visitor is logged in, since staff see edit links. No Last-Modified is sent: a timestamp
+    cannot express a site-wide change, so `If-Modified-Since` alone would keep answering 304 after one.
+    """
+
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in ("GET", "HEAD"):
+                return view_func(request, *args, **kwargs)
+
+            last_modified = get_last_modified(request, *args, **kwargs)
+            if last_modified is None:
+                return view_func(request, *args, **kwargs)
+
+            validator = ":".join(
+                [
+                    get_lang_code(),
+                    str(get_cache_version(PAGE_CACHE_NAMESPACE)),
+                    str(int(request.user.is_authenticated)),
+                    last_modified.isoformat(),
+                ]
+            )
+            etag = quote_etag(hashlib.sha1(validator.encode("utf-8")).hexdigest())
+            response = get_conditional_response(request, etag=etag)
+            if response is not None:
+                return response
+
+            response = view_func(request, *args, **kwargs)
+            if response.status_code == 200:
+                response.headers.setdefault("ETag", etag)
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def _get_shared_error_request(request):
+    # The cached 404 body is shared by every missing URL, so it is rendered as if for the language home:
+    # no resolver match, no query string (the navbar echoes ?q=) and language links to the other homes.
+    error_request = copy.copy(request)
+    error_request.path = error_request.path_info = reverse("home")
+    error_request.META = {**request.META, "QUERY_STRING": ""}
+    error_request.GET = QueryDict()
+    error_request.resolver_match = None
+    return error_request
+
+
+def get_not_found_response(request) -> HttpResponseNotFound:
+    """The 404 page, rendered once per origin and language and served to every missing URL, mostly scanner probes."""
+    # Keyed by scheme and host like the page cache, since the body embeds absolute canonical URLs.
+    # Unlike cache_anonymous_page it is shared with logged-in visitors too: that is only safe because 404.html,
+    # base.html and its partials render nothing from `user`, `perms` or `csrf_token`. Add the user to the key
+    # (or skip the cache for them) before giving the 404 page staff-only content.
+    origin_hash = _get_path_hash(request.build_absolute_uri("/"))
+    cache_key = build_cache_key(PAGE_CACHE_NAMESPACE, "not-found", origin_hash, get_lang_code())
+    content = cache.get(cache_key)
+    if content is None:
+        content = render_to_string(NOT_FOUND_TEMPLATE_NAME, request=_get_shared_error_request(request))
+        if settings.PAGE_CACHE_TIMEOUT > 0:
+            cache.set(cache_key, content, settings.PAGE_CACHE_TIMEOUT)
+    return HttpResponseNotFound(content)
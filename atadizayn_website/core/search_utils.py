@@ -0,0 +1,171 @@
+import hashlib
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector, TrigramSimilarity
+from django.db.models import Case, CharField, F, FloatField, IntegerField, Q, Value, When
+from django.db.models.functions import Coalesce, Greatest, Upper
+
+from atadizayn_website.core.cache_utils import build_cache_key
+from atadizayn_website.core.slug_utils import get_language_codes
+
+SEARCH_CONFIGS = {
+    "tr": "turkish",
+    "en": "english",
+}
+
+SEARCH_TERM_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+SEARCH_RESULT_COLUMNS = ("result_kind", "result_pk", "result_rank", "result_priority")
+
+SEARCH_CACHE_NAMESPACE = "search"
+
+# ts_rank normalization flag 32 scales a rank to rank / (rank + 1), i.e. into [0, 1).
+SEARCH_RANK_NORMALIZATION = 32
+# Highest exact/prefix bonus plus the highest trigram similarity, to scale trigram ranks into [0, 1].
+TRIGRAM_RANK_MAX = 3.0
+
+
+def get_search_config(lang_code: str) -> str:
+    return SEARCH_CONFIGS.get(lang_code, "simple")
+
+
+def get_search_vector_field(lang_code: str) -> str:
+    return f"search_vector_{lang_code}"
+
+
+def build_search_vector(weighted_fields, lang_code: str) -> SearchVector:
+    config = get_search_config(lang_code)
+    vector = None
+    for field_name, weight in weighted_fields:
+        part = SearchVector(f"{field_name}_{lang_code}", config=config, weight=weight)
+        vector = part if vector is None else vector + part
+    return vector
+
+
+def update_search_vectors(queryset, weighted_fields) -> int:
+    return queryset.update(
+        **{
+            get_search_vector_field(lang_code): build_search_vector(weighted_fields, lang_code)
+            for lang_code in get_language_codes()
+        }
+    )
+
+
+def normalize_search_query(query: str) -> str:
+    """
+    The text global_search searches for and keys its cache with: whitespace collapsed and lowercased the way
+    the database's to_tsvector/to_tsquery do it ("I" -> "i", "İ" -> "i"), so queries that share a cache entry
+    also match the same rows.
+    """
+    return " ".join((query or "").split()).replace("İ", "i").lower()
+
+
+def get_search_cache_key(normalized_query: str, lang_code: str, page_number: int) -> str:
+    query_hash = hashlib.sha1(normalized_query.encode("utf-8")).hexdigest()
+    return build_cache_key(SEARCH_CACHE_NAMESPACE, lang_code, query_hash, page_number)
+
+
+def build_search_query(query: str, lang_code: str) -> SearchQuery | None:
+    # Every term is matched as a prefix so "Bağ" still finds "Bağlantı" like the old icontains search did.
+    terms = SEARCH_TERM_PATTERN.findall(query or "")
+    if not terms:
+        return None
+
+    raw_query = " & ".join(f"{term}:*" for term in terms)
+    return SearchQuery(raw_query, config=get_search_config(lang_code), search_type="raw")
+
+
+def apply_full_text_search(queryset, query: str):
+    # search_rank is the best language's normalized ts_rank, in [0, 1) like apply_trigram_search's.
+    condition = Q()
+    language_ranks = []
+    for lang_code in get_language_codes():
+        search_query = build_search_query(query, lang_code)
+        if search_query is None:
+            return queryset.none()
+
+        vector_field = get_search_vector_field(lang_code)
+        condition |= Q(**{vector_field: search_query})
+        language_ranks.append(
+            Coalesce(
+                SearchRank(F(vector_field), search_query, normalization=SEARCH_RANK_NORMALIZATION),
+                Value(0.0),
+                output_field=FloatField(),
+            )
+        )
+
+    rank = Greatest(*language_ranks) if len(language_ranks) > 1 else language_ranks[0]
+    return queryset.filter(condition).annotate(search_rank=rank).order_by("-search_rank", "pk")
+
+
+def apply_trigram_search(queryset, query: str, fields):
+    # Matches run against UPPER(field) so both LIKE and the % operator can use the gin_trgm_ops expression indexes.
+    value = (query or "").strip()
+    if not value:
+        return queryset.none()
+
+    upper_value = value.upper()
+    aliases = {}
+    condition = Q()
+    match_bonuses = []
+    similarities = []
+    for field_name in fields:
+        alias = f"{field_name}_upper"
+        aliases[alias] = Upper(field_name)
+        condition |= Q(**{f"{alias}__contains": upper_value}) | Q(**{f"{alias}__trigram_similar": upper_value})
+        match_bonuses.append(
+            Case(
+                When(**{alias: upper_value}, then=Value(2.0)),
+                When(**{f"{alias}__startswith": upper_value}, then=Value(1.0)),
+                default=Value(0.0),
+                output_field=FloatField(),
+            )
+        )
+        similarities.append(Coalesce(TrigramSimilarity(alias, upper_value), Value(0.0), output_field=FloatField()))
+
+    match_bonus = Greatest(*match_bonuses) if len(match_bonuses) > 1 else match_bonuses[0]
+    similarity = Greatest(*similarities) if len(similarities) > 1 else similarities[0]
+    return (
+        queryset.alias(**aliases)
+        .filter(condition)
+        .annotate(search_rank=(match_bonus + similarity) / Value(TRIGRAM_RANK_MAX))
+        .order_by("-search_rank", "pk")
+    )
+
+
+def build_search_union(ranked_querysets):
+    """
+    Combines ranked querysets into one UNION ALL of (kind, pk, rank, priority) rows.
+    ranked_querysets is an ordered mapping of kind -> queryset annotated with search_rank in [0, 1]
+    (apply_full_text_search, apply_trigram_search), so ranks of different kinds are ordered on one scale;
+    the mapping order breaks ties between equally ranked results of different kinds.
+    """
+    parts = []
+    for priority, (kind, queryset) in enumerate(ranked_querysets.items()):
+        parts.append(
+            queryset.order_by()
+            .annotate(
+                result_kind=Value(kind, output_field=CharField()),
+                result_pk=F("pk"),
+                result_rank=F("search_rank"),
+                result_priority=Value(priority, output_field=IntegerField()),
+            )
+            .values_list(*SEARCH_RESULT_COLUMNS)
+        )
+
+    first, *rest = parts
+    return first.union(*rest, all=True).order_by("-result_rank", "result_priority", "result_pk")
+
+
+def hydrate_search_results(rows, loader_querysets):
+    """Loads the model instances behind (kind, pk, ...) rows, keeping the row order."""
+    pks_by_kind = {}
+    for kind, pk, *_rest in rows:
+        pks_by_kind.setdefault(kind, []).append(pk)
+
+    instances = {}
+    for kind, pks in pks_by_kind.items():
+        for instance in loader_querysets[kind].filter(pk__in=pks):
+            instances[(kind, instance.pk)] = instance
+
+    return [instances[(kind, pk)] for kind, pk, *_rest in rows if (kind, pk) in instances]
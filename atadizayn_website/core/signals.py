@@ -0,0 +1,141 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.urls import reverse
+
+from atadizayn_website.blog.models import BlogPost
+from atadizayn_website.core.asset_utils import SITE_ASSET_CACHE_NAMESPACE
+from atadizayn_website.core.cache_utils import bump_cache_version
+from atadizayn_website.core.config_utils import SITE_CONFIG_CACHE_NAMESPACE
+from atadizayn_website.core.context_processors import FOOTER_BLOG_CACHE_NAMESPACE
+from atadizayn_website.core.image_utils import image_derivatives_replaced
+from atadizayn_website.core.models import BrandCarouselImage, SiteAsset, SiteConfiguration
+from atadizayn_website.core.page_cache_utils import (
+    evict_page_paths,
+    flush_page_cache,
+    get_collection_index_paths,
+    get_localized_paths,
+)
+from atadizayn_website.core.search_utils import SEARCH_CACHE_NAMESPACE
+from atadizayn_website.core.slug_map_utils import blog_post_slugs, category_slugs, product_slugs
+from atadizayn_website.core.suggest_utils import SUGGEST_CACHE_NAMESPACE
+from atadizayn_website.products.context_processors import FOOTER_CATEGORIES_CACHE_NAMESPACE
+from atadizayn_website.products.models import (
+    Category,
+    CategoryDocument,
+    CategoryImage,
+    Product,
+    ProductDocument,
+    ProductImage,
+    ProductVariant,
+)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+@receiver(post_save, sender=ProductVariant)
+@receiver(post_delete, sender=ProductVariant)
+@receiver(post_save, sender=BlogPost)
+@receiver(post_delete, sender=BlogPost)
+def invalidate_search_cache(sender, **kwargs):
+    bump_cache_version(SEARCH_CACHE_NAMESPACE)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+@receiver(post_save, sender=ProductVariant)
+@receiver(post_delete, sender=ProductVariant)
+def invalidate_suggest_index(sender, **kwargs):
+    bump_cache_version(SUGGEST_CACHE_NAMESPACE)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_footer_categories(sender, **kwargs):
+    bump_cache_version(FOOTER_CATEGORIES_CACHE_NAMESPACE)
+
+
+@receiver(post_save, sender=BlogPost)
+@receiver(post_delete, sender=BlogPost)
+def invalidate_footer_blog_collections(sender, **kwargs):
+    bump_cache_version(FOOTER_BLOG_CACHE_NAMESPACE)
+
+
+@receiver(post_save, sender=SiteConfiguration)
+@receiver(post_delete, sender=SiteConfiguration)
+def invalidate_site_configurations(sender, **kwargs):
+    bump_cache_version(SITE_CONFIG_CACHE_NAMESPACE)
+
+
+@receiver(post_save, sender=SiteAsset)
+@receiver(post_delete, sender=SiteAsset)
+def invalidate_site_assets(sender, **kwargs):
+    bump_cache_version(SITE_ASSET_CACHE_NAMESPACE)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+@receiver(post_save, sender=BlogPost)
+@receiver(post_delete, sender=BlogPost)
+def invalidate_slug_maps(sender, **kwargs):
+    slug_map = {Category: category_slugs, Product: product_slugs, BlogPost: blog_post_slugs}[sender]
+    bump_cache_version(slug_map.namespace)
+    if sender is Category:
+        # Product URLs embed the category slug, so the product URL tables go stale with it.
+        bump_cache_version(product_slugs.namespace)
+
+
+def _get_category_page_paths(category):
+    return [*get_localized_paths(category.get_absolute_url), *get_collection_index_paths(category.collection)]
+
+
+# Category names, blog posts, assets and configuration show up in the navbar, footer or home page of every page.
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=BlogPost)
+@receiver(post_delete, sender=BlogPost)
+@receiver(post_save, sender=SiteConfiguration)
+@receiver(post_delete, sender=SiteConfiguration)
+@receiver(post_save, sender=SiteAsset)
+@receiver(post_delete, sender=SiteAsset)
+@receiver(post_save, sender=BrandCarouselImage)
+@receiver(post_delete, sender=BrandCarouselImage)
+@receiver(image_derivatives_replaced, sender=BlogPost)
+@receiver(image_derivatives_replaced, sender=BrandCarouselImage)
+def flush_cached_pages(sender, **kwargs):
+    flush_page_cache()
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+@receiver(post_save, sender=ProductVariant)
+@receiver(post_delete, sender=ProductVariant)
+@receiver(post_save, sender=ProductImage)
+@receiver(post_delete, sender=ProductImage)
+@receiver(post_save, sender=ProductDocument)
+@receiver(post_delete, sender=ProductDocument)
+@receiver(image_derivatives_replaced, sender=ProductImage)
+def evict_product_pages(sender, instance, **kwargs):
+    product = instance if isinstance(instance, Product) else instance.product
+    # products.signals records the parent before the save; a product or variant that moved affects pages on both sides.
+    moved = getattr(product, "_previous_category_id", None) not in (None, product.category_id)
+    moved = moved or getattr(instance, "_previous_product_id", None) not in (None, product.pk)
+    if moved:
+        flush_page_cache()
+        return
+    evict_page_paths([*get_localized_paths(product.get_absolute_url), *_get_category_page_paths(product.category)])
+
+
+@receiver(post_save, sender=CategoryImage)
+@receiver(post_delete, sender=CategoryImage)
+@receiver(post_save, sender=CategoryDocument)
+@receiver(post_delete, sender=CategoryDocument)
+@receiver(image_derivatives_replaced, sender=CategoryImage)
+def evict_category_pages(sender, instance, **kwargs):
+    # Category images also feed the home page carousel.
+    evict_page_paths([*_get_category_page_paths(instance.category), *get_localized_paths(lambda: reverse("home"))])
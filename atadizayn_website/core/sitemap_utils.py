@@ -0,0 +1,104 @@
+import gzip
+import hashlib
+import json
+from datetime import datetime
+
+from django.contrib.sitemaps.views import SitemapIndexItem
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.template.loader import render_to_string
+from django.urls import reverse
+
+from atadizayn_website.core.slug_utils import get_translated_field_names
+from atadizayn_website.products.models import Category
+
+SITEMAP_STORAGE_DIR = "sitemaps"
+SITEMAP_INDEX_NAME = "sitemap.xml"
+SITEMAP_MANIFEST_NAME = "manifest.json"
+SITEMAP_URL_NAME = "sitemap_section"
+
+
+def get_sitemap_file_name(section: str | None = None, page: int | None = None) -> str:
+    # Storage name of the index (no section) or of one chunk; the .gz sibling adds a suffix.
+    if section is None:
+        return f"{SITEMAP_STORAGE_DIR}/{SITEMAP_INDEX_NAME}"
+    return f"{SITEMAP_STORAGE_DIR}/sitemap-{section}-{page}.xml"
+
+
+def get_sitemap_url_fingerprint() -> str:
+    # Product URLs embed the category slug, so renaming a category changes URLs of products it did not touch.
+    rows = list(Category.objects.order_by("pk").values_list("pk", *get_translated_field_names("slug")))
+    return hashlib.sha1(repr(rows).encode("utf-8")).hexdigest()
+
+
+def get_chunk_fingerprint(sitemap, object_list) -> str:
+    """Hash of the (item, language) pairs of one chunk and their lastmod, computed without reversing any URL."""
+    get_lastmod = getattr(sitemap, "lastmod", None)
+    rows = []
+    for entry in object_list:
+        item, lang_code = entry if sitemap.i18n else (entry, None)
+        lastmod = get_lastmod(item) if callable(get_lastmod) else None
+        rows.append((getattr(item, "pk", item), lang_code, lastmod.isoformat() if lastmod else None))
+    return hashlib.sha1(repr(rows).encode("utf-8")).hexdigest()
+
+
+def paginate_sitemap(sitemap_class, chunk_size: int):
+    """
+    Instantiates the sitemap with `chunk_size` URLs per page and evaluates `items()` once, so the paginator
+    and `get_urls()` for every page reuse the same rows instead of querying them again.
+    """
+    sitemap = sitemap_class()
+    sitemap.limit = chunk_size
+    items = list(sitemap.items())
+    sitemap.items = lambda: items
+    return sitemap, sitemap.paginator
+
+
+def write_sitemap_file(name: str, content: str) -> None:
+    # The plain file and a gzip sibling for crawlers that accept it; both are replaced in place.
+    data = content.encode("utf-8")
+    for file_name, file_data in ((name, data), (f"{name}.gz", gzip.compress(data, mtime=0))):
+        if default_storage.exists(file_name):
+            default_storage.delete(file_name)
+        default_storage.save(file_name, ContentFile(file_data))
+
+
+def delete_sitemap_file(name: str) -> None:
+    for file_name in (name, f"{name}.gz"):
+        if default_storage.exists(file_name):
+            default_storage.delete(file_name)
+
+
+def render_sitemap_chunk(sitemap, page: int, site, protocol: str):
+    """Returns the urlset XML of one page and its newest lastmod (None when an item has none)."""
+    sitemap.latest_lastmod = None
+    urls = sitemap.get_urls(page=page, site=site, protocol=protocol)
+    content = render_to_string("sitemap.xml", {"urlset": urls})
+    return content, getattr(sitemap, "latest_lastmod", None)
+
+
+def render_sitemap_index(chunks, domain: str, protocol: str) -> str:
+    """`chunks` are (section, page, lastmod isoformat or None) in index order."""
+    items = [
+        SitemapIndexItem(
+            f"{protocol}://{domain}{reverse(SITEMAP_URL_NAME, kwargs={'section': section, 'page': page})}",
+            datetime.fromisoformat(lastmod) if lastmod else None,
+        )
+        for section, page, lastmod in chunks
+    ]
+    return render_to_string("sitemap_index.xml", {"sitemaps": items})
+
+
+def load_sitemap_manifest() -> dict:
+    try:
+        with default_storage.open(f"{SITEMAP_STORAGE_DIR}/{SITEMAP_MANIFEST_NAME}") as manifest_file:
+            return json.loads(manifest_file.read())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_sitemap_manifest(manifest: dict) -> None:
+    name = f"{SITEMAP_STORAGE_DIR}/{SITEMAP_MANIFEST_NAME}"
+    if default_storage.exists(name):
+        default_storage.delete(name)
+    default_storage.save(name, ContentFile(json.dumps(manifest, sort_keys=True).encode("utf-8")))
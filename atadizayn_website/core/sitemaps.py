@@ -1,6 +1,9 @@
 from django.contrib.sitemaps import Sitemap
 from django.urls import reverse
 
+from atadizayn_website.core.slug_utils import get_lang_code
+from atadizayn_website.core.url_utils import filter_routable, get_translated_urls
+
 
 class StaticViewSitemap(Sitemap):
     changefreq = "weekly"
@@ -10,7 +13,46 @@ class StaticViewSitemap(Sitemap):
     x_default = True
 
     def items(self):
-        return ["home", "part_index", "stand_index", "blog-index", "blog-announcements", "blog-policies", "blog-corporate"]
+        return [
+            "home",
+            "part_index",
+            "stand_index",
+            "blog-index",
+            "blog-announcements",
+            "blog-policies",
+            "blog-corporate",
+        ]
 
     def location(self, item):
         return reverse(item)
+
+
+class TranslatedDetailSitemap(Sitemap):
+    """
+    Detail pages of a slugged, translated model. Locations are built for all rows of a language at once
+    (core.url_utils) the first time that language is asked for, instead of get_absolute_url() per item.
+    """
+
+    changefreq = "weekly"
+    i18n = True
+    alternates = True
+    x_default = True
+
+    def __init__(self):
+        self._locations = {}
+
+    def get_queryset(self):
+        raise NotImplementedError
+
+    def items(self):
+        # Rows without any slug have no URL to list.
+        return filter_routable(self.get_queryset())
+
+    def location(self, obj):
+        lang_code = get_lang_code()
+        if lang_code not in self._locations:
+            self._locations[lang_code] = get_translated_urls(filter_routable(self.get_queryset()), lang_code)
+        return self._locations[lang_code][obj.pk]
+
+    def lastmod(self, obj):
+        return obj.updated_at
@@ -0,0 +1,116 @@
+from functools import lru_cache, wraps
+
+from django.urls import NoReverseMatch, reverse
+from django.utils.translation import override
+
+from atadizayn_website.blog.models import BlogPost
+from atadizayn_website.core.cache_utils import VersionedProcessCache
+from atadizayn_website.core.page_cache_utils import get_not_found_response
+from atadizayn_website.core.slug_utils import get_active_slug_field, get_lang_code, get_language_codes
+from atadizayn_website.core.url_utils import get_translated_urls
+from atadizayn_website.products.models import Category, Product
+
+SLUG_MAP_CACHE_NAMESPACE = "slug-map"
+
+
+class SlugMap:
+    """
+    Per-language slug -> pk table of one model, loaded lazily per process and reloaded after a save or delete
+    (see core.signals). Unknown slugs, e.g. bot probes caught by the catch-all category URL, are answered
+    from memory; known ones still load their row by primary key. A pk -> detail URL table per language,
+    reloaded on the same version and PROCESS_CACHE_TIMEOUT, serves the language switcher.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.namespace = f"{SLUG_MAP_CACHE_NAMESPACE}:{model._meta.label_lower}"
+        self.tables = VersionedProcessCache(self.namespace, self.load)
+        self.urls = VersionedProcessCache(self.namespace, self.load_urls)
+
+    def load(self, lang_code: str) -> dict:
+        slug_field = get_active_slug_field(lang_code)
+        queryset = self.model.objects.exclude(**{f"{slug_field}__isnull": True}).exclude(**{slug_field: ""})
+        return dict(queryset.values_list(slug_field, "pk"))
+
+    def load_urls(self, lang_code: str) -> dict:
+        return get_translated_urls(self.model.objects.all(), lang_code)
+
+    def resolve(self, slug_value: str) -> int | None:
+        value = (slug_value or "").strip()
+        if not value:
+            return None
+        return self.tables.get(get_lang_code()).get(value)
+
+
+category_slugs = SlugMap(Category)
+product_slugs = SlugMap(Product)
+blog_post_slugs = SlugMap(BlogPost)
+
+
+# URL keyword argument that identifies the object of each detail route.
+DETAIL_ROUTE_SLUG_MAPS = {
+    "category-detail": ("category_slug", category_slugs),
+    "product-detail": ("product_code", product_slugs),
+    "blog-detail": ("slug", blog_post_slugs),
+}
+
+
+@lru_cache(maxsize=256)
+def _reverse_in_language(view_name: str, lang_code: str, args: tuple, kwargs: tuple) -> str:
+    with override(lang_code):
+        return reverse(view_name, args=args, kwargs=dict(kwargs))
+
+
+def _get_route_switch_urls(resolver_match) -> dict:
+    route = DETAIL_ROUTE_SLUG_MAPS.get(resolver_match.url_name)
+    if route is not None:
+        kwarg_name, slug_map = route
+        pk = slug_map.resolve(resolver_match.kwargs.get(kwarg_name))
+        if pk is None:
+            return {}
+        return {lang_code: slug_map.urls.get(lang_code).get(pk) for lang_code in get_language_codes()}
+
+    # Routes without slugs (home, collection and blog indexes, search) reverse to the same few paths every time.
+    args = tuple(resolver_match.args)
+    kwargs = tuple(sorted(resolver_match.kwargs.items()))
+    try:
+        return {
+            lang_code: _reverse_in_language(resolver_match.view_name, lang_code, args, kwargs)
+            for lang_code in get_language_codes()
+        }
+    except NoReverseMatch:
+        return {}
+
+
+def get_language_switch_urls(request) -> dict:
+    """
+    Maps every language code to the current page in that language, keeping the query string. Detail pages
+    are looked up by pk in the SlugMap URL tables; other routes are memoized per process.
+    Languages it cannot map (no resolver match, unknown slug) are left out.
+    """
+    resolver_match = getattr(request, "resolver_match", None)
+    if resolver_match is None or resolver_match.url_name is None:
+        return {}
+
+    urls = _get_route_switch_urls(resolver_match)
+    query_string = request.META.get("QUERY_STRING", "")
+    return {lang_code: f"{url}?{query_string}" if query_string else url for lang_code, url in urls.items() if url}
+
+
+def require_known_slugs(**slug_maps):
+    """
+    Answers with the cached 404 page before any other work when a URL slug is missing from its SlugMap,
+    e.g. `@require_known_slugs(category_slug=category_slugs)` for the catch-all category route.
+    """
+
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            for kwarg_name, slug_map in slug_maps.items():
+                if slug_map.resolve(kwargs.get(kwarg_name)) is None:
+                    return get_not_found_response(request)
+            return view_func(request, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
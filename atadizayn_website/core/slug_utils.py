@@ -1,11 +1,28 @@
+import functools
+
 from django.conf import settings
+from django.core.exceptions import ValidationError
 from django.db.models import Q
 from django.utils.text import slugify
 from django.utils.translation import get_language
+from django.utils.translation import gettext_lazy as _
 
 
 SLUG_FIELDS = ("slug", "slug_en", "slug_tr")
 
+# Top-level URL segments a category (or any other slugged page) must not shadow; RESERVED_CATEGORY_SLUGS overrides.
+DEFAULT_RESERVED_SLUGS = (
+    "blog",
+    "admin",
+    "search",
+    "politikalar",
+    "i18n",
+    "ckeditor5",
+    "kitchen_sink",
+    "injection-products",
+    "pos-display-stands",
+)
+
 
 def get_lang_code() -> str:
     return (get_language() or settings.LANGUAGE_CODE).split("-")[0]
@@ -16,29 +33,37 @@ def get_default_lang_code() -> str:
     return (default_lang or settings.LANGUAGE_CODE).split("-")[0]
 
 
-def build_slug_lookup_q(slug_value: str, slug_fields=SLUG_FIELDS) -> Q:
-    value = (slug_value or "").strip()
-    if not value:
-        return Q(pk__in=[])
+def get_language_codes() -> list[str]:
+    return [code.split("-")[0] for code, _name in settings.LANGUAGES]
 
-    query = Q()
-    for field_name in slug_fields:
-        query |= Q(**{field_name: value})
-    return query
 
+def get_translated_field_names(field_name: str) -> list[str]:
+    # The modeltranslation base column plus one column per language, e.g. rich_text, rich_text_tr, rich_text_en.
+    return [field_name, *(f"{field_name}_{lang_code}" for lang_code in get_language_codes())]
 
-def build_active_language_slug_lookup_q(slug_value: str, slug_fields=SLUG_FIELDS) -> Q:
-    value = (slug_value or "").strip()
-    if not value:
-        return Q(pk__in=[])
 
-    lang_code = get_lang_code()
+def get_active_slug_field(lang_code: str, slug_fields=SLUG_FIELDS) -> str:
+    # The column URLs of `lang_code` are resolved against, e.g. slug_en for /en/... paths.
     language_field = f"slug_{lang_code}"
-
     if language_field not in slug_fields:
         language_field = "slug"
+    return language_field
+
+
+def find_taken_slugs(instance, slug_values, slug_fields=SLUG_FIELDS) -> set[str]:
+    """Returns the `slug_values` that another row of the instance's model uses in any slug column, in one query."""
+    values = {value for value in slug_values if value}
+    if not values:
+        return set()
+
+    queryset = type(instance).objects.all()
+    if instance.pk:
+        queryset = queryset.exclude(pk=instance.pk)
 
-    return Q(**{language_field: value})
+    condition = Q()
+    for field_name in slug_fields:
+        condition |= Q(**{f"{field_name}__in": values})
+    return {value for row in queryset.filter(condition).values_list(*slug_fields) for value in row if value in values}
 
 
 def build_unique_slug(
@@ -47,7 +72,10 @@ def build_unique_slug(
     source_text: str,
     slug_fields=SLUG_FIELDS,
 ) -> str:
-    base_slug = slugify(source_text or "", allow_unicode=False)
+    field = instance._meta.get_field(target_field)
+    # AutoSlugField columns slugify with AUTOSLUG_SLUGIFY_FUNCTION, so generated slugs match what it would produce.
+    slugify_value = getattr(field, "slugify", None) or functools.partial(slugify, allow_unicode=False)
+    base_slug = slugify_value(source_text or "")[: field.max_length].strip("-")
     if not base_slug:
         return ""
 
@@ -55,28 +83,84 @@ def build_unique_slug(
     if instance.pk:
         queryset = queryset.exclude(pk=instance.pk)
 
+    # "base", "base-2", "base-3"... all start with the base cropped for the next suffix, so one prefix scan
+    # collects every taken candidate instead of one query per suffix. Near max_length a longer suffix crops
+    # the base further ("-99" to "-100"), and the shorter prefix is scanned again.
+    scanned_prefix = None
+    taken = set()
     candidate = base_slug
     suffix = 2
-    while queryset.filter(build_slug_lookup_q(candidate, slug_fields=slug_fields)).exists():
-        candidate = f"{base_slug}-{suffix}"
+    while True:
+        scan_prefix = base_slug[: field.max_length - len(f"-{suffix}")].rstrip("-")
+        if scan_prefix != scanned_prefix:
+            condition = Q()
+            for field_name in slug_fields:
+                condition |= Q(**{f"{field_name}__startswith": scan_prefix})
+            taken = {value for row in queryset.filter(condition).values_list(*slug_fields) for value in row if value}
+            scanned_prefix = scan_prefix
+        if candidate not in taken:
+            return candidate
+        candidate = f"{scan_prefix}-{suffix}"
         suffix += 1
 
-    return candidate
 
+def fill_unique_slugs(instance, source_field: str, slug_fields=SLUG_FIELDS) -> None:
+    """
+    Model.save() helper: fills each empty language slug column from its source column (name_en -> slug_en)
+    with build_unique_slug(). AutoSlugField then finds the active language's slug set and confirms it with a
+    single query instead of probing "-2", "-3"... one query at a time.
+    """
+    for slug_field in slug_fields:
+        if slug_field == "slug" or (getattr(instance, slug_field, "") or "").strip():
+            continue
+        source_value = (getattr(instance, slug_field.replace("slug", source_field, 1), None) or "").strip()
+        if source_value:
+            setattr(instance, slug_field, build_unique_slug(instance, slug_field, source_value, slug_fields))
 
-def get_translated_slug(instance, slug_fields=SLUG_FIELDS) -> str:
-    lang_code = get_lang_code()
-    default_lang = get_default_lang_code()
 
-    preferred_fields = [f"slug_{lang_code}", f"slug_{default_lang}", "slug"]
-    for field_name in preferred_fields:
-        if field_name not in slug_fields:
-            continue
-        value = (getattr(instance, field_name, "") or "").strip()
-        if value:
-            return value
+def build_slug_candidates(instance, source_field: str, slug_fields=SLUG_FIELDS) -> dict[str, str]:
+    # Each slug column's value, or the slug its source column (name -> slug, name_en -> slug_en) would produce.
+    candidates = {}
+    for slug_field in slug_fields:
+        source_value = (getattr(instance, slug_field.replace("slug", source_field, 1), None) or "").strip()
+        slug_value = getattr(instance, slug_field, "") or slugify(source_value, allow_unicode=False)
+        candidates[slug_field] = slug_value.strip().lower()
+    return candidates
 
-    for field_name in slug_fields:
+
+def validate_unique_slugs(instance, source_field: str, conflict_message, slug_fields=SLUG_FIELDS) -> None:
+    """
+    Model.clean() helper: rejects reserved slugs and slugs another row uses in any language column.
+    All candidates are checked with a single query.
+    """
+    reserved_slugs = {slug.lower() for slug in getattr(settings, "RESERVED_CATEGORY_SLUGS", DEFAULT_RESERVED_SLUGS)}
+    slug_candidates = build_slug_candidates(instance, source_field, slug_fields)
+    taken_slugs = find_taken_slugs(instance, slug_candidates.values(), slug_fields)
+
+    errors = {}
+    for field_name, slug_value in slug_candidates.items():
+        if slug_value in taken_slugs:
+            errors[field_name] = conflict_message
+        elif slug_value and slug_value in reserved_slugs:
+            errors[field_name] = _("Bu slug kullanılamaz.")
+
+    if errors:
+        raise ValidationError(errors)
+
+
+@functools.cache
+def _get_slug_field_order(lang_code: str, default_lang: str, slug_fields) -> tuple[str, ...]:
+    preferred_fields = [f"slug_{lang_code}", f"slug_{default_lang}", "slug", *slug_fields]
+    return tuple(dict.fromkeys(field_name for field_name in preferred_fields if field_name in slug_fields))
+
+
+def get_slug_field_order(lang_code: str | None = None, slug_fields=SLUG_FIELDS) -> tuple[str, ...]:
+    # The language's own slug, then the default language's, the base column and any remaining slug field.
+    return _get_slug_field_order(lang_code or get_lang_code(), get_default_lang_code(), tuple(slug_fields))
+
+
+def get_translated_slug(instance, slug_fields=SLUG_FIELDS) -> str:
+    for field_name in get_slug_field_order(slug_fields=slug_fields):
         value = (getattr(instance, field_name, "") or "").strip()
         if value:
             return value
@@ -0,0 +1,91 @@
+from bisect import bisect_left
+
+from django.utils.translation import override
+
+from atadizayn_website.core.cache_utils import VersionedProcessCache
+from atadizayn_website.core.search_utils import SEARCH_TERM_PATTERN
+from atadizayn_website.core.slug_utils import get_language_codes
+from atadizayn_website.core.url_utils import get_translated_urls
+from atadizayn_website.products.models import Category, Product, ProductVariant
+
+SUGGEST_CACHE_NAMESPACE = "suggest"
+SUGGEST_DEFAULT_LIMIT = 8
+SUGGEST_MAX_LIMIT = 20
+SUGGEST_MIN_QUERY_LENGTH = 2
+
+# str.lower() maps "I" to "i" and "İ" to "i̇" (i + combining dot), both wrong for Turkish text.
+TURKISH_LOWER_TRANSLATION = str.maketrans({"I": "ı", "İ": "i"})
+
+
+def normalize_suggest_text(text: str, lang_code: str) -> str:
+    # Labels and typed prefixes are compared in memory only, so Turkish text can be folded the Turkish way:
+    # "IŞIK" and "ışık" share a key. Database search lowercases like PostgreSQL instead (normalize_search_query).
+    value = " ".join((text or "").split())
+    if lang_code == "tr":
+        value = value.translate(TURKISH_LOWER_TRANSLATION)
+    else:
+        value = value.replace("İ", "i")
+    return value.lower()
+
+
+class SuggestIndex:
+    """
+    Sorted array of (normalized key, suggestion id) pairs answered with bisect.
+    Every label is indexed from each of its word starts, so "klip" finds "Raf Klipsi" and "100" finds "RK-100".
+    """
+
+    def __init__(self, lang_code: str, suggestions):
+        self.suggestions = list(suggestions)
+        entries = set()
+        for suggestion_id, suggestion in enumerate(self.suggestions):
+            key = normalize_suggest_text(suggestion["label"], lang_code)
+            for match in SEARCH_TERM_PATTERN.finditer(key):
+                entries.add((key[match.start() :], suggestion_id))
+        self.entries = sorted(entries)
+
+    def lookup(self, prefix: str, limit: int):
+        results = []
+        seen = set()
+        position = bisect_left(self.entries, (prefix,))
+        while position < len(self.entries) and len(results) < limit:
+            key, suggestion_id = self.entries[position]
+            if not key.startswith(prefix):
+                break
+            if suggestion_id not in seen:
+                seen.add(suggestion_id)
+                results.append(self.suggestions[suggestion_id])
+            position += 1
+        return results
+
+
+def _collect_suggestions():
+    name_fields = [f"name_{lang_code}" for lang_code in get_language_codes()]
+    category_urls = get_translated_urls(Category.objects.all())
+    for category in Category.objects.only("id", "name", *name_fields):
+        if category.pk in category_urls:
+            yield {"kind": "category", "label": category.name, "url": category_urls[category.pk]}
+
+    product_urls = get_translated_urls(Product.objects.all())
+    for product in Product.objects.only("id", "name", *name_fields):
+        if product.pk in product_urls:
+            yield {"kind": "product", "label": product.name, "url": product_urls[product.pk]}
+
+    for product_id, code in ProductVariant.objects.order_by("code").values_list("product_id", "code"):
+        if code and product_id in product_urls:
+            yield {"kind": "variant", "label": code, "url": product_urls[product_id]}
+
+
+def build_suggest_index(lang_code: str) -> SuggestIndex:
+    with override(lang_code):
+        return SuggestIndex(lang_code, _collect_suggestions())
+
+
+# Built lazily per language and process; a version bump from core.signals triggers a rebuild on next use.
+suggest_indexes = VersionedProcessCache(SUGGEST_CACHE_NAMESPACE, build_suggest_index)
+
+
+def get_suggestions(query: str, lang_code: str, limit: int = SUGGEST_DEFAULT_LIMIT):
+    prefix = normalize_suggest_text(query, lang_code)
+    if len(prefix) < SUGGEST_MIN_QUERY_LENGTH:
+        return []
+    return suggest_indexes.get(lang_code).lookup(prefix, limit)
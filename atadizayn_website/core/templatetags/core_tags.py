@@ -1,13 +1,11 @@
-import os
-
 from django import template
-from django.urls import reverse, translate_url
-from django.utils.safestring import mark_safe
-from django.utils.translation import override
-
-from atadizayn_website.core.slug_utils import get_translated_slug
+from django.urls import translate_url
+from django.utils.html import format_html, format_html_join
 
-from ..models import SiteAsset, SiteConfiguration
+from atadizayn_website.core.asset_utils import get_site_asset
+from atadizayn_website.core.config_utils import get_site_config
+from atadizayn_website.core.image_utils import RESPONSIVE_IMAGE_ENCODINGS, build_srcset
+from atadizayn_website.core.slug_map_utils import get_language_switch_urls
 
 register = template.Library()
 
@@ -18,41 +16,13 @@ def get_language_switch_url(context, language_code):
     if request is None:
         return "/"
 
-    resolver_match = getattr(request, "resolver_match", None)
-    url_name = getattr(resolver_match, "url_name", None)
-
-    if url_name == "product-detail":
-        product = context.get("product")
-        category = context.get("category")
-        if product is not None and category is None:
-            category = getattr(product, "category", None)
-
-        if product is not None and category is not None:
-            with override(language_code):
-                category_slug = get_translated_slug(category)
-                product_slug = get_translated_slug(product)
-                return reverse(
-                    "product-detail",
-                    kwargs={
-                        "category_slug": category_slug,
-                        "product_code": product_slug,
-                    },
-                )
-
-    if url_name == "category-detail":
-        category = context.get("category")
-        if category is not None:
-            with override(language_code):
-                category_slug = get_translated_slug(category)
-                return reverse("category-detail", kwargs={"category_slug": category_slug})
-
-    if url_name == "blog-detail":
-        post = context.get("post") or context.get("object")
-        if post is not None:
-            with override(language_code):
-                post_slug = get_translated_slug(post)
-                return reverse("blog-detail", kwargs={"slug": post_slug})
-
+    # Precomputed by the language_switch_urls context processor; translate_url only for pages it cannot map.
+    switch_urls = context.get("language_switch_urls")
+    if switch_urls is None:
+        switch_urls = get_language_switch_urls(request)
+    url = switch_urls.get(language_code)
+    if url:
+        return url
     return translate_url(request.get_full_path(), language_code)
 
 
@@ -62,11 +32,16 @@ def get_config(key, default=""):
     Returns the value of a SiteConfiguration by key.
     Usage: {% get_config 'contact_email' 'info@example.com' %}
     """
-    try:
-        config = SiteConfiguration.objects.get(key=key)
-        return config.value or default
-    except SiteConfiguration.DoesNotExist:
-        return default
+    return get_site_config(key, default)
+
+
+@register.simple_tag
+def get_asset(key):
+    """
+    Returns the registry entry (url, media_type, width, height, label) of the site asset with the given key.
+    Usage: {% get_asset 'stands_banner' as banner %}
+    """
+    return get_site_asset(key)
 
 
 @register.simple_tag
@@ -75,13 +50,8 @@ def asset_url(key):
     Returns the URL of the site asset with the given key.
     Usage: {% asset_url 'my_key' %}
     """
-    try:
-        asset = SiteAsset.objects.get(key=key)
-        if asset.file:
-            return asset.file.url
-        return ""
-    except SiteAsset.DoesNotExist:
-        return ""
+    asset = get_site_asset(key)
+    return asset["url"] if asset else ""
 
 
 @register.simple_tag
@@ -90,24 +60,63 @@ def render_asset(key, css_class=""):
     Renders the asset based on its file type (Image or Video).
     Usage: {% render_asset 'hero_video' 'w-100' %}
     """
-    try:
-        asset = SiteAsset.objects.get(key=key)
-        if not asset.file:
-            return ""
-
-        url = asset.file.url
-        # Simple extension check
-        ext = os.path.splitext(asset.file.name)[1].lower()
-
-        if ext in [".jpg", ".jpeg", ".png", ".gif", ".svg", ".webp"]:
-            return mark_safe(f'<img src="{url}" alt="{asset.description or asset.key}" class="{css_class}">')
-        elif ext in [".mp4", ".webm", ".ogg", ".mov"]:
-            return mark_safe(f'<video src="{url}" class="{css_class}" autoplay loop muted playsinline></video>')
-        else:
-            # Fallback for generic files
-            return mark_safe(
-                f'<a href="{url}" class="{css_class}" target="_blank">{asset.description or asset.key}</a>'
+    asset = get_site_asset(key)
+    if not asset:
+        return ""
+
+    if asset["media_type"] == "image":
+        if asset["width"] and asset["height"]:
+            return format_html(
+                '<img src="{}" alt="{}" class="{}" width="{}" height="{}">',
+                asset["url"],
+                asset["label"],
+                css_class,
+                asset["width"],
+                asset["height"],
             )
+        return format_html('<img src="{}" alt="{}" class="{}">', asset["url"], asset["label"], css_class)
+    elif asset["media_type"] == "video":
+        return format_html(
+            '<video src="{}" class="{}" autoplay loop muted playsinline></video>', asset["url"], css_class
+        )
+    else:
+        # Fallback for generic files
+        return format_html('<a href="{}" class="{}" target="_blank">{}</a>', asset["url"], css_class, asset["label"])
+
 
-    except SiteAsset.DoesNotExist:
+@register.simple_tag
+def responsive_image(field_file, variants, alt="", sizes="100vw", css_class="", loading="lazy"):
+    """
+    Renders the image as <picture> with AVIF/WebP srcset sources from its upload-time derivatives and the
+    original as the <img> fallback. Without derivatives (SVG, not generated yet) a plain <img> is rendered.
+    Usage: {% responsive_image image.image image.image_variants alt=image.alt_text sizes="50vw" css_class="w-100" %}
+    """
+    if not field_file:
         return ""
+
+    variants = variants or {}
+    dimensions = ""
+    if variants.get("width") and variants.get("height"):
+        dimensions = format_html(' width="{}" height="{}"', variants["width"], variants["height"])
+    img = format_html(
+        '<img src="{}" alt="{}" class="{}"{} loading="{}" decoding="async">',
+        field_file.url,
+        alt,
+        css_class,
+        dimensions,
+        loading,
+    )
+
+    sources = variants.get("sources") or {}
+    source_rows = [
+        (mime_type, build_srcset(field_file.storage, sources[format_name]), sizes)
+        for format_name, (_pillow_format, mime_type, _options) in RESPONSIVE_IMAGE_ENCODINGS.items()
+        if sources.get(format_name)
+    ]
+    if not source_rows:
+        return img
+    return format_html(
+        '<picture class="responsive-image">{}{}</picture>',
+        format_html_join("", '<source type="{}" srcset="{}" sizes="{}">', source_rows),
+        img,
+    )
@@ -1,2 +1,215 @@
+from unittest.mock import patch
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache, caches
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+from django.template.loader import render_to_string
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django.utils.translation import override
+
+from atadizayn_website.core.explain_utils import find_sequential_scans
+from atadizayn_website.core.models import SiteConfiguration
+from atadizayn_website.core.page_cache_utils import cache_anonymous_page
+from atadizayn_website.core.search_utils import normalize_search_query
+from atadizayn_website.core.slug_utils import build_unique_slug
+from atadizayn_website.products.models import Category, Product
+
+# Pages render {% static %} without a collectstatic manifest.
+TEST_STORAGES = {
+    **settings.STORAGES,
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+}
+
+
+@override_settings(STORAGES=TEST_STORAGES)
+class GlobalSearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # PostgreSQL lowercases "IŞIK" to "işik" and "Işık" to "işık": two different words for search.
+        cls.category = Category.objects.create(name_tr="IŞIK Pano", name_en="Light Panel", collection="stand")
+        Product.objects.create(category=cls.category, name_tr="ışık kutusu", name_en="Light Box")
+        Product.objects.create(category=cls.category, name_tr="ışık bandı", name_en="Light Strip")
+
+    def setUp(self):
+        caches["search"].clear()
+
+    def search(self, query, **params):
+        with override("tr"):
+            url = reverse("global_search")
+        return self.client.get(url, {"q": query, **params})
+
+    def test_query_is_lowercased_like_postgresql(self):
+        self.assertEqual(normalize_search_query("  IŞIK   İSTANBUL "), "işik istanbul")
+
+    def test_upper_case_query_matches_like_lower_case_query(self):
+        for query in ("kutusu", "KUTUSU", "  Kutusu  "):
+            with self.subTest(query=query):
+                self.assertEqual(self.search(query).context["page_obj"].paginator.count, 1)
+
+    def test_queries_postgresql_tells_apart_do_not_share_a_cache_entry(self):
+        self.assertEqual(self.search("IŞIK").context["page_obj"].paginator.count, 1)
+        self.assertEqual(self.search("ışık").context["page_obj"].paginator.count, 2)
+
+    def test_invalid_page_numbers_reuse_the_first_page_entry(self):
+        self.search("kutusu")
+        entries = len(caches["search"]._cache)
+        for page in ("abc", "0", "-1", "1"):
+            with self.subTest(page=page):
+                response = self.search("kutusu", page=page)
+                self.assertEqual(response.context["page_obj"].number, 1)
+        self.assertEqual(len(caches["search"]._cache), entries)
+
+
+@override_settings(PAGE_CACHE_TIMEOUT=600)
+class CacheAnonymousPageTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.calls = 0
+
+    def get(self, view):
+        request = RequestFactory().get("/tr/")
+        request.user = AnonymousUser()
+        return view(request)
+
+    def count_calls(self, response):
+        @cache_anonymous_page
+        def view(request):
+            self.calls += 1
+            return response(request)
+
+        return view
+
+    def test_hit_replays_the_view_headers(self):
+        def response(request):
+            page = HttpResponse("page", content_type="text/html; charset=utf-8")
+            page.headers["Content-Language"] = "tr"
+            page.headers["Vary"] = "Accept-Language, Cookie"
+            page.headers["Cache-Control"] = "max-age=60"
+            return page
+
+        view = self.count_calls(response)
+        self.get(view)
+        hit = self.get(view)
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(hit.content, b"page")
+        self.assertEqual(hit.headers["Content-Type"], "text/html; charset=utf-8")
+        self.assertEqual(hit.headers["Content-Language"], "tr")
+        self.assertEqual(hit.headers["Vary"], "Accept-Language, Cookie")
+        self.assertEqual(hit.headers["Cache-Control"], "max-age=60")
+
+    def test_page_that_needs_a_csrf_cookie_is_not_cached(self):
+        def response(request):
+            # What {% csrf_token %} does; the cookie itself is only set later by CsrfViewMiddleware.
+            get_token(request)
+            return HttpResponse("form")
+
+        view = self.count_calls(response)
+        self.get(view)
+        self.get(view)
+        self.assertEqual(self.calls, 2)
+
+
+@override_settings(STORAGES=TEST_STORAGES, PAGE_CACHE_TIMEOUT=0)
+class SwitchLanguageTests(TestCase):
+    def switch(self, lang_code, next_url):
+        return self.client.get(reverse("switch_language", args=[lang_code]), {"next": next_url})
+
+    def test_switch_sets_the_language_cookie_for_unprefixed_urls(self):
+        response = self.switch("en", "/en/")
+        self.assertRedirects(response, "/en/", fetch_redirect_response=False)
+        self.assertEqual(response.cookies[settings.LANGUAGE_COOKIE_NAME].value, "en")
+        response = self.client.get("/", HTTP_ACCEPT_LANGUAGE="tr")
+        self.assertRedirects(response, "/en/", fetch_redirect_response=False)
+
+    def test_external_next_falls_back_to_home(self):
+        response = self.switch("en", "https://example.com/")
+        self.assertRedirects(response, "/en/", fetch_redirect_response=False)
+
+    def test_unknown_language_is_not_found(self):
+        self.assertEqual(self.switch("de", "/").status_code, 404)
+
+    def test_navbar_links_go_through_the_switch(self):
+        response = self.client.get("/tr/")
+        self.assertContains(response, f'href="{reverse("switch_language", args=["en"])}?next=/en/"')
+
+
+@override_settings(STORAGES=TEST_STORAGES, PAGE_CACHE_TIMEOUT=600)
+class NotFoundPageTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_status_and_language_of_rendered_and_cached_body(self):
+        for lang_code in ("tr", "en"):
+            for path in ("missing", "other-missing"):
+                with self.subTest(lang_code=lang_code, path=path):
+                    response = self.client.get(f"/{lang_code}/{path}/")
+                    self.assertEqual(response.status_code, 404)
+                    self.assertEqual(response.headers["Content-Language"], lang_code)
+                    self.assertContains(
+                        response, f'<link rel="canonical" href="http://testserver/{lang_code}/">', status_code=404
+                    )
+
+    def test_body_is_rendered_again_after_navbar_or_configuration_changes(self):
+        with patch("atadizayn_website.core.page_cache_utils.render_to_string", wraps=render_to_string) as render:
+            self.client.get("/tr/missing/")
+            self.client.get("/tr/other-missing/")
+            self.assertEqual(render.call_count, 1)
+
+            SiteConfiguration.objects.create(key="company_phone", value="0212 000 00 00")
+            self.client.get("/tr/missing/")
+            self.assertEqual(render.call_count, 2)
+
+            Category.objects.create(name_tr="Yeni Stand", name_en="New Stand", collection="stand")
+            response = self.client.get("/tr/missing/")
+            self.assertEqual(render.call_count, 3)
+            self.assertContains(response, "Yeni Stand", status_code=404)
+
+
+class FindSequentialScansTests(SimpleTestCase):
+    tables = {"products_product"}
+
+    def scan(self, node_type, relation="products_product", **fields):
+        return {"Node Type": node_type, "Relation Name": relation, **fields}
+
+    def test_seq_scan_on_a_checked_table_is_flagged(self):
+        plan = {"Node Type": "Hash Join", "Plans": [self.scan("Seq Scan"), self.scan("Seq Scan", "products_category")]}
+        self.assertEqual(find_sequential_scans(plan, self.tables), ["products_product"])
+
+    def test_index_scans_without_a_condition_are_not_flagged(self):
+        ordered = {"Node Type": "Limit", "Plans": [self.scan("Index Scan", **{"Index Name": "product_name_idx"})]}
+        self.assertEqual(find_sequential_scans(ordered, self.tables), [])
+        self.assertEqual(find_sequential_scans(self.scan("Index Only Scan"), self.tables), [])
+
+    def test_index_scan_discarding_most_rows_is_flagged(self):
+        plan = self.scan("Index Scan", Filter="(category_id = 1)", **{"Actual Rows": 3, "Rows Removed by Filter": 997})
+        self.assertEqual(find_sequential_scans(plan, self.tables), ["products_product"])
+        plan["Rows Removed by Filter"] = 1
+        self.assertEqual(find_sequential_scans(plan, self.tables), [])
+
+
+class BuildUniqueSlugTests(TestCase):
+    base = "a" * 255
+
+    def take(self, slugs):
+        Category.objects.bulk_create(
+            Category(name_tr=slug, name_en=slug, slug=slug, slug_tr=slug, slug_en=f"en-{index}")
+            for index, slug in enumerate(slugs)
+        )
+
+    def suffixed(self, suffix: int) -> str:
+        tail = f"-{suffix}"
+        return f"{self.base[: 255 - len(tail)]}{tail}"
+
+    def test_suffix_keeps_the_slug_within_max_length(self):
+        self.take([self.base, *(self.suffixed(suffix) for suffix in range(2, 10))])
+        slug = build_unique_slug(Category(), "slug_tr", self.base + "aaa")
+        self.assertEqual(slug, self.suffixed(10))
+        self.assertEqual(len(slug), 255)
+
+    def test_longer_suffix_sees_rows_its_shorter_base_matches(self):
+        # "-1000" crops the base one character more than "-999"; the row already using it must still be found.
+        self.take([self.base, *(self.suffixed(suffix) for suffix in range(2, 1001))])
+        self.assertEqual(build_unique_slug(Category(), "slug_tr", self.base), self.suffixed(1001))
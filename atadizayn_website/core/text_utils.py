@@ -0,0 +1,27 @@
+import html
+import re
+
+from django.utils.html import strip_tags
+
+from atadizayn_website.core.slug_utils import get_language_codes
+
+BLOCK_BOUNDARY_PATTERN = re.compile(
+    r"<\s*(br|/p|/div|/li|/h[1-6]|/td|/th|/tr|/blockquote|/figcaption)\b[^>]*>", re.IGNORECASE
+)
+
+
+def html_to_plain_text(value: str) -> str:
+    # Block boundaries become spaces so "<p>a</p><p>b</p>" reads "a b" instead of "ab".
+    text = BLOCK_BOUNDARY_PATTERN.sub(" ", value or "")
+    text = html.unescape(strip_tags(text)).replace("\xa0", " ")
+    return " ".join(text.split())
+
+
+def sync_plain_text_fields(instance, source_field: str, target_field: str) -> list[str]:
+    """Refreshes every per-language plain-text column from its HTML source and returns the updated field names."""
+    updated_fields = []
+    for lang_code in get_language_codes():
+        target_name = f"{target_field}_{lang_code}"
+        setattr(instance, target_name, html_to_plain_text(getattr(instance, f"{source_field}_{lang_code}", None)))
+        updated_fields.append(target_name)
+    return updated_fields
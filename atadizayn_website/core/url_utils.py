@@ -0,0 +1,87 @@
+import functools
+
+from django.db.models import Q
+from django.urls import reverse
+from django.utils.translation import override
+
+from atadizayn_website.core.slug_utils import SLUG_FIELDS, get_lang_code, get_slug_field_order
+
+# Keyword arguments of the slugged detail routes, in the order rows pass them to build_urls().
+ROUTE_ARGUMENTS = {
+    "category-detail": ("category_slug",),
+    "product-detail": ("category_slug", "product_code"),
+    "blog-detail": ("slug",),
+}
+# Detail route of each slugged model and, per route argument, the relation its slug columns are read through.
+MODEL_ROUTES = {
+    "products.category": ("category-detail", ("",)),
+    "products.product": ("product-detail", ("category__", "")),
+    "blog.blogpost": ("blog-detail", ("",)),
+}
+
+
+@functools.cache
+def get_route_template(url_name: str, lang_code: str) -> str:
+    """
+    str.format template of a route in a language, e.g. "/en/{0}/{1}/" for product-detail: one reverse()
+    with placeholder slugs per route and language, since the URLconf does not change while the process runs.
+    """
+    markers = [f"urlarg{index}x" for index in range(len(ROUTE_ARGUMENTS[url_name]))]
+    with override(lang_code):
+        path = reverse(url_name, kwargs=dict(zip(ROUTE_ARGUMENTS[url_name], markers)))
+    template = path.replace("{", "{{").replace("}", "}}")
+    for index, marker in enumerate(markers):
+        template = template.replace(marker, f"{{{index}}}")
+    return template
+
+
+def build_urls(url_name: str, rows, lang_code: str | None = None) -> list[str]:
+    """
+    URLs of `url_name` for rows of slugs already in the target language, e.g. (category slug, product slug)
+    tuples for product-detail. Slugs are not validated or quoted; they must match the route's slug converters.
+    """
+    template = get_route_template(url_name, lang_code or get_lang_code())
+    return [template.format(*row) for row in rows]
+
+
+def _first_slug(values) -> str:
+    for value in values:
+        if value and (value := value.strip()):
+            return value
+    return ""
+
+
+def filter_routable(queryset):
+    """
+    Rows of `queryset` that have a detail URL in every language: each route slug, the category's included,
+    has a non-empty slug column to fall back on. get_translated_urls() leaves the other rows out.
+    """
+    _url_name, relations = MODEL_ROUTES[queryset.model._meta.label_lower]
+    for relation in relations:
+        condition = Q()
+        for field_name in SLUG_FIELDS:
+            condition |= Q(**{f"{relation}{field_name}__gt": ""})
+        queryset = queryset.filter(condition)
+    return queryset
+
+
+def get_translated_urls(queryset, lang_code: str | None = None) -> dict:
+    """
+    Maps the pk of every row in `queryset` (categories, products or blog posts) to its detail URL in
+    `lang_code`, picking slugs like get_translated_slug(). One values_list() query reads the slug columns,
+    the category's included, so no model instances or related objects are loaded. Rows without a slug are left out.
+    """
+    lang_code = lang_code or get_lang_code()
+    url_name, relations = MODEL_ROUTES[queryset.model._meta.label_lower]
+    template = get_route_template(url_name, lang_code)
+    slug_fields = get_slug_field_order(lang_code)
+    width = len(slug_fields)
+    columns = [f"{relation}{field_name}" for relation in relations for field_name in slug_fields]
+
+    urls = {}
+    # Columns are named per language already; modeltranslation's rewriting adds a per-row fallback pass.
+    for pk, *values in queryset.rewrite(False).order_by().values_list("pk", *columns):
+        slugs = [_first_slug(values[start : start + width]) for start in range(0, len(values), width)]
+        if all(slugs):
+            urls[pk] = template.format(*slugs)
+    return urls
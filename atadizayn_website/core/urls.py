@@ -6,5 +6,6 @@ from . import views
 urlpatterns = [
     path("", views.home, name="home"),
     path("search/", views.global_search, name="global_search"),
+    path("search/suggest/", views.search_suggest, name="search_suggest"),
     path("kitchen_sink/", TemplateView.as_view(template_name="kitchen_sink.html"), name="kitchen_sink"),
 ]
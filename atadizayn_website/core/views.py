@@ -1,115 +1,201 @@
+from django.conf import settings
+from django.contrib.sitemaps.views import sitemap
+from django.core.cache import caches
+from django.core.files.storage import default_storage
 from django.core.paginator import Paginator
-from django.db.models import Q
+from django.http import Http404, HttpResponse, HttpResponseRedirect, JsonResponse
 from django.shortcuts import render
+from django.urls import reverse
 from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date, url_has_allowed_host_and_scheme
+from django.utils.translation import override
+from django.views.decorators.cache import never_cache
 
 from atadizayn_website.blog.models import BlogPost
 from atadizayn_website.core.models import BrandCarouselImage
+from atadizayn_website.core.page_cache_utils import cache_anonymous_page, get_not_found_response
+from atadizayn_website.core.search_utils import (
+    apply_full_text_search,
+    apply_trigram_search,
+    build_search_union,
+    get_search_cache_key,
+    hydrate_search_results,
+    normalize_search_query,
+)
+from atadizayn_website.core.sitemap_utils import get_sitemap_file_name
+from atadizayn_website.core.slug_utils import get_lang_code
+from atadizayn_website.core.suggest_utils import SUGGEST_DEFAULT_LIMIT, SUGGEST_MAX_LIMIT, get_suggestions
+from atadizayn_website.products.loaders import load_carousel_categories
 from atadizayn_website.products.models import Category, Product, ProductVariant
 
+SEARCH_RESULTS_PER_PAGE = 12
+HOME_CAROUSEL_SIZE = 3
+SEARCH_VECTOR_FIELDS = ("search_vector_tr", "search_vector_en")
+
+
+def _ranked_search_querysets(query):
+    # Full-text search over the per-language search vectors, prefix-matched and ranked.
+    # Variants match by code or size: exact and prefix hits first, then trigram similarity for typos.
+    return {
+        "category": apply_full_text_search(Category.objects.all(), query),
+        "product": apply_full_text_search(Product.objects.all(), query),
+        "variant": apply_trigram_search(ProductVariant.objects.all(), query, ProductVariant.SEARCH_FIELDS),
+        "post": apply_full_text_search(
+            BlogPost.objects.filter(
+                status="published",
+                publish_date__lte=timezone.now(),
+                collection__in=["post", "announcement"],
+            ),
+            query,
+        ),
+    }
+
+
+def _search_result_loaders():
+    # Only the rows of the visible page are hydrated, so images are prefetched for at most one page.
+    return {
+        "category": Category.objects.defer(*SEARCH_VECTOR_FIELDS).prefetch_related("images"),
+        "product": Product.objects.defer(*SEARCH_VECTOR_FIELDS).prefetch_related("images"),
+        "variant": ProductVariant.objects.select_related("product")
+        .defer(*(f"product__{field_name}" for field_name in SEARCH_VECTOR_FIELDS))
+        .prefetch_related("product__images"),
+        "post": BlogPost.objects.defer(*SEARCH_VECTOR_FIELDS),
+    }
+
 
 def global_search(request):
     query = request.GET.get("q")
     results = []
+    search_cache = caches["search"]
+    normalized_query = None
+    cached = None
 
     if query:
-        # We use icontains for "elastic" partial matching (e.g. "Bağ" matching "Bağlantı")
-        # Search in Categories
-        categories = (
-            Category.objects.filter(
-                Q(name__icontains=query)
-                | Q(name_en__icontains=query)
-                | Q(name_tr__icontains=query)
-                | Q(description__icontains=query)
-                | Q(description_en__icontains=query)
-                | Q(description_tr__icontains=query)
-                | Q(rich_text__icontains=query)
-                | Q(rich_text_en__icontains=query)
-                | Q(rich_text_tr__icontains=query)
-            )
-            .prefetch_related("images")
-            .distinct()
-        )
+        lang_code = get_lang_code()
+        normalized_query = normalize_search_query(query)
+        # Ranking, counting and slicing happen in SQL over a UNION ALL of (kind, pk, rank) rows
+        results = build_search_union(_ranked_search_querysets(normalized_query))
+        # Like Paginator.get_page(), anything but a page number reads page 1.
+        page_number = request.GET.get("page", "")
+        page_number = int(page_number) if page_number.isdigit() and int(page_number) > 0 else 1
+        cached = search_cache.get(get_search_cache_key(normalized_query, lang_code, page_number))
 
-        # Search in Products
-        products = (
-            Product.objects.filter(
-                Q(name__icontains=query)
-                | Q(name_en__icontains=query)
-                | Q(name_tr__icontains=query)
-                | Q(description__icontains=query)
-                | Q(description_en__icontains=query)
-                | Q(description_tr__icontains=query)
-                | Q(rich_text__icontains=query)
-                | Q(rich_text_en__icontains=query)
-                | Q(rich_text_tr__icontains=query)
-            )
-            .prefetch_related("images")
-            .distinct()
-        )
+    # Pagination
+    paginator = Paginator(results, SEARCH_RESULTS_PER_PAGE)
+    if cached:
+        # Cached (count, rows): the union is never evaluated, only the page's objects are loaded.
+        paginator.count, rows = cached
+        page_obj = paginator.page(page_number)
+    else:
+        page_obj = paginator.get_page(request.GET.get("page"))
+        rows = list(page_obj.object_list)
+        if normalized_query:
+            # Stored under the page actually shown, so out-of-range numbers do not add copies of the last page.
+            cache_key = get_search_cache_key(normalized_query, lang_code, page_obj.number)
+            search_cache.set(cache_key, (paginator.count, rows))
 
-        # Search in Variants by Code or Size
-        variants = (
-            ProductVariant.objects.filter(Q(code__icontains=query) | Q(size__icontains=query))
-            .select_related("product")
-            .prefetch_related("product__images")
-        )
+    if query:
+        page_obj.object_list = hydrate_search_results(rows, _search_result_loaders())
 
-        blog_posts = BlogPost.objects.filter(
-            Q(title__icontains=query)
-            | Q(title_en__icontains=query)
-            | Q(title_tr__icontains=query)
-            | Q(meta_description__icontains=query)
-            | Q(meta_description_en__icontains=query)
-            | Q(meta_description_tr__icontains=query)
-            | Q(content__icontains=query)
-            | Q(content_en__icontains=query)
-            | Q(content_tr__icontains=query),
-            status="published",
-            publish_date__lte=timezone.now(),
-            collection__in=["post", "announcement"],
-        ).distinct()
+    return render(request, "core/search_results.html", {"page_obj": page_obj, "query": query})
 
-        results = list(categories) + list(products) + list(variants) + list(blog_posts)
 
-    # Pagination
-    paginator = Paginator(results, 12)
-    page_number = request.GET.get("page")
-    page_obj = paginator.get_page(page_number)
+def search_suggest(request):
+    # Typeahead for the search boxes, answered from the in-process prefix index without touching the catalog tables.
+    query = request.GET.get("q", "")
+    try:
+        limit = int(request.GET.get("limit", SUGGEST_DEFAULT_LIMIT))
+    except ValueError:
+        limit = SUGGEST_DEFAULT_LIMIT
+    limit = max(1, min(limit, SUGGEST_MAX_LIMIT))
 
-    return render(request, "core/search_results.html", {"page_obj": page_obj, "query": query})
+    return JsonResponse({"query": query, "results": get_suggestions(query, get_lang_code(), limit)})
 
 
+@cache_anonymous_page
 def home(request):
-    categories = list(Category.objects.order_by("name").prefetch_related("images"))
-    carousel_categories = []
-    for category in categories:
-        images = list(category.images.all())
-        if not images:
-            continue
-        category.carousel_image = images[0]
-        carousel_categories.append(category)
-        if len(carousel_categories) >= 3:
-            break
+    carousel_categories = load_carousel_categories(HOME_CAROUSEL_SIZE)
 
     # Get brand carousel images
     brands = BrandCarouselImage.objects.filter(is_active=True)
-    latest_blog_post = BlogPost.objects.filter(
-        status="published",
-        publish_date__lte=timezone.now(),
-        collection="post",
-    ).order_by("-publish_date").first()
-    latest_announcement_post = BlogPost.objects.filter(
-        status="published",
-        publish_date__lte=timezone.now(),
-        collection="announcement",
-    ).order_by("-publish_date").first()
+
+    # Latest post of each collection in one query (PostgreSQL DISTINCT ON).
+    latest_posts = {
+        post.collection: post
+        for post in BlogPost.objects.filter(
+            status="published",
+            publish_date__lte=timezone.now(),
+            collection__in=["post", "announcement"],
+        )
+        .defer(*SEARCH_VECTOR_FIELDS)
+        .order_by("collection", "-publish_date", "-id")
+        .distinct("collection")
+    }
 
     context = {
-        "categories": categories,
         "carousel_categories": carousel_categories,
         "brands": brands,
-        "latest_blog_post": latest_blog_post,
-        "latest_announcement_post": latest_announcement_post,
+        "latest_blog_post": latest_posts.get("post"),
+        "latest_announcement_post": latest_posts.get("announcement"),
     }
     return render(request, "home.html", context)
+
+
+def page_not_found(request, exception=None):
+    # handler404: one cached body per language instead of a full template render for every probe.
+    return get_not_found_response(request)
+
+
+@never_cache
+def switch_language(request, lang_code):
+    """
+    Target of the navbar language links. Like Django's `set_language` it stores the choice in the language cookie,
+    so unprefixed URLs keep the chosen language, but it is a plain GET: cached pages carry no CSRF token.
+    """
+    if lang_code not in dict(settings.LANGUAGES):
+        raise Http404
+    next_url = request.GET.get("next", "")
+    if not url_has_allowed_host_and_scheme(
+        next_url, allowed_hosts={request.get_host()}, require_https=request.is_secure()
+    ):
+        with override(lang_code):
+            next_url = reverse("home")
+    response = HttpResponseRedirect(next_url)
+    response.set_cookie(
+        settings.LANGUAGE_COOKIE_NAME,
+        lang_code,
+        max_age=settings.LANGUAGE_COOKIE_AGE,
+        path=settings.LANGUAGE_COOKIE_PATH,
+        domain=settings.LANGUAGE_COOKIE_DOMAIN,
+        secure=settings.LANGUAGE_COOKIE_SECURE,
+        httponly=settings.LANGUAGE_COOKIE_HTTPONLY,
+        samesite=settings.LANGUAGE_COOKIE_SAMESITE,
+    )
+    return response
+
+
+def sitemap_file(request, sitemaps, section=None, page=None):
+    """
+    Serves the sitemap index (no section) or one sitemap file written by `manage.py generate_sitemaps`,
+    gzip-encoded when the client accepts it. Until the files exist the index is rendered live.
+    """
+    name = get_sitemap_file_name(section, page)
+    if not default_storage.exists(name):
+        if section is None:
+            return sitemap(request, sitemaps)
+        raise Http404
+
+    last_modified = int(default_storage.get_modified_time(name).timestamp())
+    response = get_conditional_response(request, last_modified=last_modified)
+    if response is None:
+        gzip_name = f"{name}.gz"
+        use_gzip = "gzip" in request.headers.get("Accept-Encoding", "") and default_storage.exists(gzip_name)
+        with default_storage.open(gzip_name if use_gzip else name) as sitemap_xml:
+            response = HttpResponse(sitemap_xml.read(), content_type="application/xml")
+        if use_gzip:
+            response.headers["Content-Encoding"] = "gzip"
+        response.headers["Last-Modified"] = http_date(last_modified)
+    patch_vary_headers(response, ["Accept-Encoding"])
+    response.headers["X-Robots-Tag"] = "noindex, noodp, noarchive"
+    return response
@@ -6,3 +6,6 @@ class ProductsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "atadizayn_website.products"
     verbose_name = _("Ürün yönetimi")
+
+    def ready(self):
+        from atadizayn_website.products import signals  # noqa: F401
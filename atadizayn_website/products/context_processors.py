@@ -1,11 +1,35 @@
+from django.core.cache import cache
+
+from atadizayn_website.core.cache_utils import build_cache_key
+from atadizayn_website.core.slug_utils import get_lang_code, get_language_codes
+
 from .models import Category
 
+FOOTER_CATEGORIES_CACHE_NAMESPACE = "footer-categories"
+FOOTER_CATEGORIES_CACHE_TIMEOUT = 60 * 60 * 24
 
-def footer_categories(request):
+
+def _build_footer_categories():
+    label_fields = [
+        f"{field_name}_{lang_code}" for lang_code in get_language_codes() for field_name in ("name", "slug")
+    ]
     categories_by_collection = {}
     for choice_value, choice_label in Category.COLLECTION_CHOICES:
-        categories_by_collection[choice_value] = {
-            "label": choice_label,
-            "categories": Category.objects.filter(collection=choice_value).order_by("name"),
-        }
+        categories_by_collection[choice_value] = {"label": str(choice_label), "categories": []}
+
+    categories = Category.objects.filter(collection__in=categories_by_collection).order_by("name")
+    for category in categories.only("id", "name", "slug", "collection", *label_fields):
+        categories_by_collection[category.collection]["categories"].append(
+            {"name": category.name, "url": category.get_absolute_url()}
+        )
+    return categories_by_collection
+
+
+def footer_categories(request):
+    # Same for every visitor: names and URLs are cached per language until a Category changes (see core.signals).
+    cache_key = build_cache_key(FOOTER_CATEGORIES_CACHE_NAMESPACE, get_lang_code())
+    categories_by_collection = cache.get(cache_key)
+    if categories_by_collection is None:
+        categories_by_collection = _build_footer_categories()
+        cache.set(cache_key, categories_by_collection, FOOTER_CATEGORIES_CACHE_TIMEOUT)
     return {"footer_categories_by_collection": categories_by_collection}
@@ -0,0 +1,33 @@
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from .models import Category, Product, ProductVariant
+
+
+def _count_subquery(queryset, group_field: str):
+    counts = queryset.order_by().values(group_field).annotate(total=Count("pk")).values("total")
+    return Coalesce(Subquery(counts), Value(0))
+
+
+def recount_categories(category_ids=None) -> int:
+    """Recomputes products_count and items_count (variants) in one UPDATE; all categories when no ids are given."""
+    queryset = Category.objects.all()
+    if category_ids is not None:
+        category_ids = {category_id for category_id in category_ids if category_id is not None}
+        if not category_ids:
+            return 0
+        queryset = queryset.filter(pk__in=category_ids)
+
+    return queryset.update(
+        products_count=_count_subquery(Product.objects.filter(category=OuterRef("pk")), "category"),
+        items_count=_count_subquery(
+            ProductVariant.objects.filter(product__category=OuterRef("pk")), "product__category"
+        ),
+    )
+
+
+def recount_product_categories(product_ids) -> int:
+    category_ids = Product.objects.filter(pk__in=[pk for pk in product_ids if pk is not None]).values_list(
+        "category_id", flat=True
+    )
+    return recount_categories(list(category_ids))
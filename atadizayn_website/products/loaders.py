@@ -0,0 +1,147 @@
+from django.db.models import Exists, OuterRef, Prefetch
+from django.http import Http404
+from django.shortcuts import get_object_or_404
+
+from atadizayn_website.core.slug_map_utils import category_slugs, product_slugs
+from atadizayn_website.core.slug_utils import get_translated_field_names
+
+from .models import Category, CategoryImage, Product, ProductImage
+
+SEARCH_VECTOR_FIELDS = ("search_vector_tr", "search_vector_en")
+
+
+def _resolve_product_lookup(category_slug: str, product_slug: str) -> dict:
+    category_pk = category_slugs.resolve(category_slug)
+    product_pk = product_slugs.resolve(product_slug)
+    if category_pk is None or product_pk is None:
+        raise Http404
+    return {"pk": product_pk, "category_id": category_pk}
+
+
+def _resolve_category_pk(category_slug: str) -> int:
+    category_pk = category_slugs.resolve(category_slug)
+    if category_pk is None:
+        raise Http404
+    return category_pk
+
+
+def load_product_page_bundle(category_slug: str, product_slug: str) -> dict:
+    """
+    Loads everything product_detail renders in a fixed four queries, whatever the number of variants:
+    the product joined to its category, then its images, documents and variants.
+    The returned dict is used as the template context as-is.
+    """
+    category_heavy_fields = [
+        f"category__{field_name}"
+        for field_name in (
+            *get_translated_field_names("rich_text"),
+            *get_translated_field_names("rich_text_plain"),
+            *SEARCH_VECTOR_FIELDS,
+        )
+    ]
+    queryset = (
+        Product.objects.select_related("category")
+        .defer(*SEARCH_VECTOR_FIELDS, *category_heavy_fields)
+        .prefetch_related("images", "documents", "variants")
+    )
+    product = get_object_or_404(queryset, **_resolve_product_lookup(category_slug, product_slug))
+
+    return {
+        "category": product.category,
+        "product": product,
+        "images": list(product.images.all()),
+        "documents": list(product.documents.all()),
+        "variants": list(product.variants.all()),
+    }
+
+
+def get_primary_images_prefetch(image_model=ProductImage, lookup: str = "images") -> Prefetch:
+    # At most one image per parent (is_primary first, then sort order), fetched for all parents in one query.
+    queryset = (
+        image_model.objects.exclude(image="").exclude(image__isnull=True).order_by("-is_primary", "sort_order", "id")
+    )
+    return Prefetch(lookup, queryset=queryset[:1], to_attr="primary_images")
+
+
+def get_link_fields() -> list[str]:
+    # Columns needed to render a name and get_absolute_url() in any language.
+    return ["id", *get_translated_field_names("name"), *get_translated_field_names("slug")]
+
+
+def load_category_page_bundle(category_slug: str) -> dict:
+    """
+    Loads everything category_detail renders in a fixed five queries, whatever the number of products:
+    the category, its images and documents, its product cards and one primary image per card.
+    """
+    category = get_object_or_404(
+        Category.objects.defer(*get_translated_field_names("rich_text_plain"), *SEARCH_VECTOR_FIELDS).prefetch_related(
+            "images", "documents"
+        ),
+        pk=_resolve_category_pk(category_slug),
+    )
+    # Cards only show a name, a link and one image, so the HTML and text columns stay in the database.
+    # The reverse manager hands each product this category instance, so get_absolute_url needs no extra query.
+    products = category.products.only("category_id", *get_link_fields()).prefetch_related(get_primary_images_prefetch())
+
+    return {
+        "category": category,
+        "images": list(category.images.all()),
+        "documents": list(category.documents.all()),
+        "products": list(products),
+        "other_categories": Category.objects.exclude(pk=category.pk).only("collection", *get_link_fields())[:6],
+    }
+
+
+def load_collection_categories(collection: str):
+    """Category cards of a collection landing page: stored counts and one primary image per card, two queries."""
+    return list(
+        Category.objects.filter(collection=collection)
+        .defer(
+            *get_translated_field_names("rich_text"),
+            *get_translated_field_names("rich_text_plain"),
+            *SEARCH_VECTOR_FIELDS,
+        )
+        .prefetch_related(get_primary_images_prefetch(CategoryImage))
+    )
+
+
+def load_carousel_categories(limit: int):
+    """
+    The first `limit` categories by name that have an image, each with carousel_image set, in two queries.
+    The EXISTS filter and LIMIT run in SQL, so the cost does not grow with the catalog.
+    """
+    has_image = CategoryImage.objects.filter(category=OuterRef("pk")).exclude(image="").exclude(image__isnull=True)
+    categories = list(
+        Category.objects.filter(Exists(has_image))
+        .order_by("name")
+        .defer(
+            *get_translated_field_names("rich_text"),
+            *get_translated_field_names("rich_text_plain"),
+            *SEARCH_VECTOR_FIELDS,
+        )
+        .prefetch_related(get_primary_images_prefetch(CategoryImage))[:limit]
+    )
+    for category in categories:
+        category.carousel_image = category.primary_images[0]
+    return categories
+
+
+def get_category_page_last_modified(request, category_slug: str):
+    # Product, image and document changes are recorded on the category's updated_at by products.signals.
+    category_pk = category_slugs.resolve(category_slug)
+    if category_pk is None:
+        return None
+    return Category.objects.filter(pk=category_pk).values_list("updated_at", flat=True).first()
+
+
+def get_product_page_last_modified(request, category_slug: str, product_code: str):
+    category_pk = category_slugs.resolve(category_slug)
+    product_pk = product_slugs.resolve(product_code)
+    if category_pk is None or product_pk is None:
+        return None
+    timestamps = (
+        Product.objects.filter(pk=product_pk, category_id=category_pk)
+        .values_list("updated_at", "category__updated_at")
+        .first()
+    )
+    return max(timestamps) if timestamps else None
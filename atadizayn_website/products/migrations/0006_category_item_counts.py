@@ -0,0 +1,45 @@
+# Generated by Django 5.2.18 on 2026-10-17 22:13
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def count_category_items(apps, schema_editor):
+    Category = apps.get_model("products", "Category")
+    Product = apps.get_model("products", "Product")
+    ProductVariant = apps.get_model("products", "ProductVariant")
+    product_counts = (
+        Product.objects.filter(category=OuterRef("pk")).order_by().values("category").annotate(total=Count("pk"))
+    )
+    variant_counts = (
+        ProductVariant.objects.filter(product__category=OuterRef("pk"))
+        .order_by()
+        .values("product__category")
+        .annotate(total=Count("pk"))
+    )
+    Category.objects.update(
+        products_count=Coalesce(Subquery(product_counts.values("total")), Value(0)),
+        items_count=Coalesce(Subquery(variant_counts.values("total")), Value(0)),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0005_rich_text_plain'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='category',
+            name='items_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Çeşit sayısı'),
+        ),
+        migrations.AddField(
+            model_name='category',
+            name='products_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Ürün sayısı'),
+        ),
+        migrations.RunPython(count_category_items, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-17 22:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0006_category_item_counts'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(fields=['collection', 'name_tr'], name='category_collection_tr_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(fields=['collection', 'name_en'], name='category_collection_en_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='categoryimage',
+            index=models.Index(fields=['category', '-is_primary', 'sort_order', 'id'], name='categoryimage_primary_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['category', 'name_tr'], name='product_category_tr_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['category', 'name_en'], name='product_category_en_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='productimage',
+            index=models.Index(fields=['product', '-is_primary', 'sort_order', 'id'], name='productimage_primary_idx'),
+        ),
+    ]
@@ -1,15 +1,22 @@
 from autoslug import AutoSlugField
-from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.urls import reverse
 from django.utils import timezone
-from django.utils.html import strip_tags
-from django.utils.text import slugify
 from django.utils.translation import gettext_lazy as _
 from django_ckeditor_5.fields import CKEditor5Field
 
-from atadizayn_website.core.slug_utils import build_slug_lookup_q, get_default_lang_code, get_translated_slug
+from atadizayn_website.core.image_utils import image_derivatives_on_commit
+from atadizayn_website.core.search_utils import update_search_vectors
+from atadizayn_website.core.slug_utils import (
+    fill_unique_slugs,
+    get_default_lang_code,
+    get_translated_slug,
+    validate_unique_slugs,
+)
+from atadizayn_website.core.text_utils import html_to_plain_text, sync_plain_text_fields
 
 
 class Category(models.Model):
@@ -17,6 +24,12 @@ class Category(models.Model):
         ("stand", _("Standlar")),
         ("part", _("Parçalar")),
     ]
+    SEARCH_FIELDS = (
+        ("name", "A"),
+        ("description", "B"),
+        ("rich_text_plain", "C"),
+    )
+    PLAIN_TEXT_FIELDS = {"rich_text": "rich_text_plain"}
 
     name = models.CharField(
         max_length=255,
@@ -48,31 +61,63 @@ class Category(models.Model):
         null=True,
         verbose_name=_("Zengin metin"),
     )
+    rich_text_plain = models.TextField(
+        blank=True,
+        default="",
+        editable=False,
+        verbose_name=_("Zengin metin (düz)"),
+    )
     publish_date = models.DateField(
         default=timezone.localdate,
         null=True,
         blank=True,
         verbose_name=_("Yayım tarihi"),
     )
+    # Denormalized counts kept current by products.signals; fix drift with `manage.py recount_category_items`.
+    products_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name=_("Ürün sayısı"),
+    )
+    items_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name=_("Çeşit sayısı"),
+    )
 
     created_at = models.DateTimeField(auto_now_add=True, verbose_name=_("Oluşturulma tarihi"))
     updated_at = models.DateTimeField(auto_now=True, verbose_name=_("Güncellenme tarihi"))
 
+    search_vector_tr = SearchVectorField(null=True, editable=False)
+    search_vector_en = SearchVectorField(null=True, editable=False)
+
     class Meta:
         ordering = ["name"]
         verbose_name = _("Kategori")
         verbose_name_plural = _("Kategoriler")
+        indexes = [
+            GinIndex(fields=["search_vector_tr"], name="category_search_tr_gin"),
+            GinIndex(fields=["search_vector_en"], name="category_search_en_gin"),
+            # Collection pages and the footer: filter by collection, ordered by the active language's name.
+            models.Index(fields=["collection", "name_tr"], name="category_collection_tr_idx"),
+            models.Index(fields=["collection", "name_en"], name="category_collection_en_idx"),
+        ]
 
     def __str__(self) -> str:
         return self.name
 
     def save(self, *args, **kwargs):
+        fill_unique_slugs(self, "name")
+        for source_field, target_field in self.PLAIN_TEXT_FIELDS.items():
+            sync_plain_text_fields(self, source_field, target_field)
+
         if not (self.description or "").strip():
-            plain_content = strip_tags(self.rich_text or "").strip()
+            plain_content = self.rich_text_plain
             if plain_content:
                 self.description = plain_content
 
         super().save(*args, **kwargs)
+        update_search_vectors(type(self).objects.filter(pk=self.pk), self.SEARCH_FIELDS)
 
     def get_absolute_url(self) -> str:
         category_slug = get_translated_slug(self)
@@ -80,8 +125,7 @@ class Category(models.Model):
 
     @staticmethod
     def _has_visible_text(value: str) -> bool:
-        plain_value = strip_tags(value or "").replace("\xa0", " ").strip()
-        return bool(plain_value)
+        return bool(html_to_plain_text(value))
 
     def clean(self):
         super().clean()
@@ -101,61 +145,7 @@ class Category(models.Model):
         if errors:
             raise ValidationError(errors)
 
-        reserved_slugs = {
-            slug.lower()
-            for slug in getattr(
-                settings,
-                "RESERVED_CATEGORY_SLUGS",
-                (
-                    "blog",
-                    "admin",
-                    "search",
-                    "politikalar",
-                    "i18n",
-                    "ckeditor5",
-                    "kitchen_sink",
-                    "injection-products",
-                    "pos-display-stands",
-                ),
-            )
-        }
-        slug_candidates = {
-            "slug": (self.slug or slugify((self.name or "").strip(), allow_unicode=False)).strip().lower(),
-            "slug_en": (
-                (
-                    getattr(self, "slug_en", "")
-                    or slugify(((getattr(self, "name_en", None) or "").strip()), allow_unicode=False)
-                )
-                .strip()
-                .lower()
-            ),
-            "slug_tr": (
-                (
-                    getattr(self, "slug_tr", "")
-                    or slugify(((getattr(self, "name_tr", None) or "").strip()), allow_unicode=False)
-                )
-                .strip()
-                .lower()
-            ),
-        }
-
-        errors = {}
-        for field_name, slug_value in slug_candidates.items():
-            if slug_value and slug_value in reserved_slugs:
-                errors[field_name] = _("Bu slug kullanılamaz.")
-
-        queryset = type(self).objects.all()
-        if self.pk:
-            queryset = queryset.exclude(pk=self.pk)
-
-        for field_name, slug_value in slug_candidates.items():
-            if not slug_value:
-                continue
-            if queryset.filter(build_slug_lookup_q(slug_value)).exists():
-                errors[field_name] = _("Bu slug başka bir kategoride kullanılıyor.")
-
-        if errors:
-            raise ValidationError(errors)
+        validate_unique_slugs(self, "name", _("Bu slug başka bir kategoride kullanılıyor."))
 
 
 class CategoryImage(models.Model):
@@ -185,11 +175,21 @@ class CategoryImage(models.Model):
         default=0,
         verbose_name=_("Sıralama"),
     )
+    image_variants = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        verbose_name=_("Duyarlı görsel türevleri"),
+    )
 
     class Meta:
         ordering = ["sort_order", "id"]
         verbose_name = _("Kategori görseli")
         verbose_name_plural = _("Kategori görselleri")
+        indexes = [
+            # Primary image per category (see products.loaders.get_primary_images_prefetch).
+            models.Index(fields=["category", "-is_primary", "sort_order", "id"], name="categoryimage_primary_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.category.name} görseli"
@@ -197,7 +197,8 @@ class CategoryImage(models.Model):
     def save(self, *args, **kwargs):
         if not (self.alt_text or "").strip():
             self.alt_text = (self.category.name or "").strip()
-        super().save(*args, **kwargs)
+        with image_derivatives_on_commit(self, "image", "image_variants"):
+            super().save(*args, **kwargs)
 
 
 class CategoryDocument(models.Model):
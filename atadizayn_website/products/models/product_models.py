@@ -1,18 +1,33 @@
 from autoslug import AutoSlugField
-from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models.functions import Upper
 from django.urls import reverse
 from django.utils import timezone
-from django.utils.html import strip_tags
-from django.utils.text import slugify
 from django.utils.translation import gettext_lazy as _
 from django_ckeditor_5.fields import CKEditor5Field
 
-from atadizayn_website.core.slug_utils import build_slug_lookup_q, get_default_lang_code, get_translated_slug
+from atadizayn_website.core.image_utils import image_derivatives_on_commit
+from atadizayn_website.core.search_utils import update_search_vectors
+from atadizayn_website.core.slug_utils import (
+    fill_unique_slugs,
+    get_default_lang_code,
+    get_translated_slug,
+    validate_unique_slugs,
+)
+from atadizayn_website.core.text_utils import html_to_plain_text, sync_plain_text_fields
 
 
 class Product(models.Model):
+    SEARCH_FIELDS = (
+        ("name", "A"),
+        ("description", "B"),
+        ("rich_text_plain", "C"),
+    )
+    PLAIN_TEXT_FIELDS = {"rich_text": "rich_text_plain"}
+
     category = models.ForeignKey(
         "products.Category",
         on_delete=models.PROTECT,
@@ -48,25 +63,46 @@ class Product(models.Model):
         null=True,
         verbose_name=_("Zengin metin"),
     )
+    rich_text_plain = models.TextField(
+        blank=True,
+        default="",
+        editable=False,
+        verbose_name=_("Zengin metin (düz)"),
+    )
 
     created_at = models.DateTimeField(auto_now_add=True, verbose_name=_("Oluşturulma tarihi"))
     updated_at = models.DateTimeField(auto_now=True, verbose_name=_("Güncellenme tarihi"))
 
+    search_vector_tr = SearchVectorField(null=True, editable=False)
+    search_vector_en = SearchVectorField(null=True, editable=False)
+
     class Meta:
         ordering = ["name"]
         verbose_name = _("Ürün")
         verbose_name_plural = _("Ürünler")
+        indexes = [
+            GinIndex(fields=["search_vector_tr"], name="product_search_tr_gin"),
+            GinIndex(fields=["search_vector_en"], name="product_search_en_gin"),
+            # Category pages list a category's products ordered by the active language's name.
+            models.Index(fields=["category", "name_tr"], name="product_category_tr_idx"),
+            models.Index(fields=["category", "name_en"], name="product_category_en_idx"),
+        ]
 
     def __str__(self) -> str:
         return self.name
 
     def save(self, *args, **kwargs):
+        fill_unique_slugs(self, "name")
+        for source_field, target_field in self.PLAIN_TEXT_FIELDS.items():
+            sync_plain_text_fields(self, source_field, target_field)
+
         if not (self.description or "").strip():
-            plain_content = strip_tags(self.rich_text or "").strip()
+            plain_content = self.rich_text_plain
             if plain_content:
                 self.description = plain_content
 
         super().save(*args, **kwargs)
+        update_search_vectors(type(self).objects.filter(pk=self.pk), self.SEARCH_FIELDS)
 
     def get_absolute_url(self) -> str:
         category_slug = get_translated_slug(self.category)
@@ -97,66 +133,11 @@ class Product(models.Model):
         if errors:
             raise ValidationError(errors)
 
-        reserved_slugs = {
-            slug.lower()
-            for slug in getattr(
-                settings,
-                "RESERVED_CATEGORY_SLUGS",
-                (
-                    "blog",
-                    "admin",
-                    "search",
-                    "politikalar",
-                    "i18n",
-                    "ckeditor5",
-                    "kitchen_sink",
-                    "injection-products",
-                    "pos-display-stands",
-                ),
-            )
-        }
-        slug_candidates = {
-            "slug": (self.slug or slugify((self.name or "").strip(), allow_unicode=False)).strip().lower(),
-            "slug_en": (
-                (
-                    getattr(self, "slug_en", "")
-                    or slugify(((getattr(self, "name_en", None) or "").strip()), allow_unicode=False)
-                )
-                .strip()
-                .lower()
-            ),
-            "slug_tr": (
-                (
-                    getattr(self, "slug_tr", "")
-                    or slugify(((getattr(self, "name_tr", None) or "").strip()), allow_unicode=False)
-                )
-                .strip()
-                .lower()
-            ),
-        }
-
-        errors = {}
-        for field_name, slug_value in slug_candidates.items():
-            if slug_value and slug_value in reserved_slugs:
-                errors[field_name] = _("Bu slug kullanılamaz.")
-
-        queryset = type(self).objects.all()
-        if self.pk:
-            queryset = queryset.exclude(pk=self.pk)
-
-        for field_name, slug_value in slug_candidates.items():
-            if not slug_value:
-                continue
-            if queryset.filter(build_slug_lookup_q(slug_value)).exists():
-                errors[field_name] = _("Bu slug başka bir üründe kullanılıyor.")
-
-        if errors:
-            raise ValidationError(errors)
+        validate_unique_slugs(self, "name", _("Bu slug başka bir üründe kullanılıyor."))
 
     @staticmethod
     def _has_visible_text(value: str) -> bool:
-        plain_value = strip_tags(value or "").replace("\xa0", " ").strip()
-        return bool(plain_value)
+        return bool(html_to_plain_text(value))
 
 
 class ProductImage(models.Model):
@@ -186,11 +167,21 @@ class ProductImage(models.Model):
         default=0,
         verbose_name=_("Sıralama"),
     )
+    image_variants = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        verbose_name=_("Duyarlı görsel türevleri"),
+    )
 
     class Meta:
         ordering = ["sort_order", "id"]
         verbose_name = _("Ürün görseli")
         verbose_name_plural = _("Ürün görselleri")
+        indexes = [
+            # Primary image per product (see products.loaders.get_primary_images_prefetch).
+            models.Index(fields=["product", "-is_primary", "sort_order", "id"], name="productimage_primary_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.product.name} görseli"
@@ -198,7 +189,8 @@ class ProductImage(models.Model):
     def save(self, *args, **kwargs):
         if not (self.alt_text or "").strip():
             self.alt_text = (self.product.name or "").strip()
-        super().save(*args, **kwargs)
+        with image_derivatives_on_commit(self, "image", "image_variants"):
+            super().save(*args, **kwargs)
 
 
 class ProductDocument(models.Model):
@@ -257,6 +249,8 @@ class ProductDocument(models.Model):
 
 
 class ProductVariant(models.Model):
+    SEARCH_FIELDS = ("code", "size_tr", "size_en")
+
     product = models.ForeignKey(
         "products.Product",
         on_delete=models.CASCADE,
@@ -303,6 +297,11 @@ class ProductVariant(models.Model):
         verbose_name = _("Ürün Varyantı")
         verbose_name_plural = _("Ürün Varyantları")
         ordering = ["code"]
+        indexes = [
+            GinIndex(OpClass(Upper("code"), name="gin_trgm_ops"), name="variant_code_trgm"),
+            GinIndex(OpClass(Upper("size_tr"), name="gin_trgm_ops"), name="variant_size_tr_trgm"),
+            GinIndex(OpClass(Upper("size_en"), name="gin_trgm_ops"), name="variant_size_en_trgm"),
+        ]
 
     def __str__(self):
         return f"{self.product.name} - {self.code} ({self.size})"
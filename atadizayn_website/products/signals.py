@@ -0,0 +1,87 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .counters import recount_categories, recount_product_categories
+from .models import Category, CategoryDocument, CategoryImage, Product, ProductDocument, ProductImage, ProductVariant
+
+
+def touch_updated_at(model, pks) -> int:
+    # QuerySet.update() skips save(), so no search-vector rebuild and no further signals.
+    pks = {pk for pk in pks if pk is not None}
+    if not pks:
+        return 0
+    return model.objects.filter(pk__in=pks).update(updated_at=timezone.now())
+
+
+@receiver(pre_save, sender=Product)
+def remember_previous_category(sender, instance, raw=False, **kwargs):
+    # A product moved to another category must also be uncounted from the old one.
+    instance._previous_category_id = None
+    if instance.pk and not raw:
+        instance._previous_category_id = (
+            sender.objects.filter(pk=instance.pk).values_list("category_id", flat=True).first()
+        )
+
+
+@receiver(post_save, sender=Product)
+def recount_product_category(sender, instance, raw=False, **kwargs):
+    if not raw:
+        recount_categories([instance.category_id, getattr(instance, "_previous_category_id", None)])
+
+
+@receiver(post_delete, sender=Product)
+def recount_deleted_product_category(sender, instance, **kwargs):
+    recount_categories([instance.category_id])
+
+
+@receiver(pre_save, sender=ProductVariant)
+def remember_previous_product(sender, instance, raw=False, **kwargs):
+    instance._previous_product_id = None
+    if instance.pk and not raw:
+        instance._previous_product_id = (
+            sender.objects.filter(pk=instance.pk).values_list("product_id", flat=True).first()
+        )
+
+
+@receiver(post_save, sender=ProductVariant)
+def recount_variant_category(sender, instance, raw=False, **kwargs):
+    if not raw:
+        recount_product_categories([instance.product_id, getattr(instance, "_previous_product_id", None)])
+
+
+@receiver(post_delete, sender=ProductVariant)
+def recount_deleted_variant_category(sender, instance, **kwargs):
+    recount_product_categories([instance.product_id])
+
+
+# Child rows have no timestamps of their own, so changes are recorded on the parents' updated_at,
+# which the conditional GET validators of category_detail and product_detail read.
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+def touch_product_category(sender, instance, raw=False, **kwargs):
+    if not raw:
+        touch_updated_at(Category, [instance.category_id, getattr(instance, "_previous_category_id", None)])
+
+
+@receiver(post_save, sender=ProductVariant)
+@receiver(post_delete, sender=ProductVariant)
+@receiver(post_save, sender=ProductImage)
+@receiver(post_delete, sender=ProductImage)
+@receiver(post_save, sender=ProductDocument)
+@receiver(post_delete, sender=ProductDocument)
+def touch_parent_product(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    product_ids = [instance.product_id, getattr(instance, "_previous_product_id", None)]
+    touch_updated_at(Product, product_ids)
+    touch_updated_at(Category, Product.objects.filter(pk__in=product_ids).values_list("category_id", flat=True))
+
+
+@receiver(post_save, sender=CategoryImage)
+@receiver(post_delete, sender=CategoryImage)
+@receiver(post_save, sender=CategoryDocument)
+@receiver(post_delete, sender=CategoryDocument)
+def touch_parent_category(sender, instance, raw=False, **kwargs):
+    if not raw:
+        touch_updated_at(Category, [instance.category_id])
@@ -1,37 +1,17 @@
-from django.contrib.sitemaps import Sitemap
+from atadizayn_website.core.sitemaps import TranslatedDetailSitemap
 
 from .models import Category, Product
 
 
-class CategorySitemap(Sitemap):
-    changefreq = "weekly"
+class CategorySitemap(TranslatedDetailSitemap):
     priority = 0.7
-    i18n = True
-    alternates = True
-    x_default = True
 
-    def items(self):
+    def get_queryset(self):
         return Category.objects.all().order_by("pk")
 
-    def location(self, obj):
-        return obj.get_absolute_url()
 
-    def lastmod(self, obj):
-        return obj.updated_at
-
-
-class ProductSitemap(Sitemap):
-    changefreq = "weekly"
+class ProductSitemap(TranslatedDetailSitemap):
     priority = 0.6
-    i18n = True
-    alternates = True
-    x_default = True
-
-    def items(self):
-        return Product.objects.select_related("category").all().order_by("pk")
-
-    def location(self, obj):
-        return obj.get_absolute_url()
 
-    def lastmod(self, obj):
-        return obj.updated_at
+    def get_queryset(self):
+        return Product.objects.all().order_by("pk")
@@ -1,2 +1,219 @@
+import shutil
+import tempfile
+from io import BytesIO
 
-# Create your tests here.
+from django.conf import settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.db.models.signals import post_save
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils.http import http_date
+from django.utils.translation import override
+from PIL import Image
+
+from atadizayn_website.core.page_cache_utils import flush_page_cache, get_page_cache_key
+from atadizayn_website.core.slug_map_utils import category_slugs, product_slugs
+
+from .loaders import load_carousel_categories, load_category_page_bundle, load_product_page_bundle
+from .models import (
+    Category,
+    CategoryDocument,
+    CategoryImage,
+    Product,
+    ProductDocument,
+    ProductImage,
+    ProductVariant,
+)
+
+# Pages render {% static %} without a collectstatic manifest; the page cache would hide every query after the first.
+TEST_SETTINGS = {
+    "STORAGES": {
+        **settings.STORAGES,
+        "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+    },
+    "PAGE_CACHE_TIMEOUT": 0,
+}
+
+
+def create_product(category, name: str, images: int = 0, documents: int = 0, variants: int = 0) -> Product:
+    product = Product.objects.create(category=category, name_tr=name, name_en=name)
+    add_product_rows(product, images, documents, variants)
+    return product
+
+
+def add_product_rows(product, images: int = 0, documents: int = 0, variants: int = 0) -> None:
+    # Files are only named, never read: a stored name skips the image derivative pipeline.
+    start = product.images.count() + product.documents.count() + product.variants.count()
+    for index in range(start, start + images):
+        ProductImage.objects.create(product=product, image=f"products/images/test-{index}.jpg")
+    for index in range(start, start + documents):
+        ProductDocument.objects.create(product=product, file=f"products/documents/test-{index}.pdf")
+    for index in range(start, start + variants):
+        ProductVariant.objects.create(product=product, code=f"{product.slug_tr.upper()}-{index}")
+
+
+class PageQueryCountMixin:
+    def get_page_queries(self, url: str) -> int:
+        # The slug maps, footer and site configuration tables are per-process caches; warm them first.
+        self.client.get(url)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+
+@override_settings(**TEST_SETTINGS)
+class ProductPageBundleTests(PageQueryCountMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = Category.objects.create(name_tr="Raf Aksesuarları", name_en="Shelf", collection="part")
+        cls.product = create_product(cls.category, "Raf Klipsi", images=2, documents=2, variants=3)
+
+    def get_url(self) -> str:
+        with override("tr"):
+            return self.product.get_absolute_url()
+
+    def test_bundle_loads_in_four_queries(self):
+        category_slugs.resolve(self.category.slug_tr)
+        product_slugs.resolve(self.product.slug_tr)
+        with override("tr"), self.assertNumQueries(4):
+            bundle = load_product_page_bundle(self.category.slug_tr, self.product.slug_tr)
+            self.assertEqual(bundle["category"].pk, self.category.pk)
+        self.assertEqual((len(bundle["images"]), len(bundle["documents"]), len(bundle["variants"])), (2, 2, 3))
+
+    def test_page_queries_do_not_grow_with_images_documents_and_variants(self):
+        url = self.get_url()
+        queries = self.get_page_queries(url)
+        add_product_rows(self.product, images=3, documents=3, variants=10)
+        self.assertEqual(self.get_page_queries(url), queries)
+
+
+@override_settings(**TEST_SETTINGS)
+class CategoryPageBundleTests(PageQueryCountMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = Category.objects.create(name_tr="Teşhir Standları", name_en="Display Stands", collection="stand")
+        CategoryImage.objects.create(category=cls.category, image="categories/images/test-0.jpg")
+        CategoryDocument.objects.create(category=cls.category, file="categories/documents/test-0.pdf")
+        create_product(cls.category, "Zemin Standı", images=2)
+        create_product(cls.category, "Tezgah Standı")
+        Category.objects.create(name_tr="Raf Klipsleri", name_en="Shelf Clips", collection="part")
+
+    def get_url(self) -> str:
+        with override("tr"):
+            return self.category.get_absolute_url()
+
+    def test_bundle_loads_in_five_queries(self):
+        category_slugs.resolve(self.category.slug_tr)
+        with override("tr"), self.assertNumQueries(5):
+            bundle = load_category_page_bundle(self.category.slug_tr)
+        self.assertEqual((len(bundle["images"]), len(bundle["documents"]), len(bundle["products"])), (1, 1, 2))
+
+    def test_page_queries_do_not_grow_with_products_images_and_categories(self):
+        url = self.get_url()
+        queries = self.get_page_queries(url)
+        for index in range(5):
+            create_product(self.category, f"Ek Stand {index}", images=2, variants=2)
+            Category.objects.create(name_tr=f"Ek Kategori {index}", name_en=f"Extra {index}", collection="part")
+        CategoryImage.objects.create(category=self.category, image="categories/images/test-1.jpg")
+        CategoryDocument.objects.create(category=self.category, file="categories/documents/test-1.pdf")
+        self.assertEqual(self.get_page_queries(url), queries)
+
+
+@override_settings(**TEST_SETTINGS)
+class CarouselCategoriesTests(PageQueryCountMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for index in range(5):
+            category = Category.objects.create(
+                name_tr=f"Kategori {index}", name_en=f"Category {index}", collection="part"
+            )
+            if index % 2 == 0:
+                CategoryImage.objects.create(category=category, image=f"categories/images/test-{index}-a.jpg")
+                CategoryImage.objects.create(
+                    category=category, image=f"categories/images/test-{index}-b.jpg", is_primary=True
+                )
+
+    def test_loads_limited_categories_with_images_in_two_queries(self):
+        with self.assertNumQueries(2):
+            categories = load_carousel_categories(2)
+        self.assertEqual([category.name_tr for category in categories], ["Kategori 0", "Kategori 2"])
+        self.assertTrue(all(category.carousel_image.is_primary for category in categories))
+
+    def test_home_queries_do_not_grow_with_categories(self):
+        with override("tr"):
+            url = reverse("home")
+        queries = self.get_page_queries(url)
+        for index in range(5, 15):
+            category = Category.objects.create(
+                name_tr=f"Kategori {index}", name_en=f"Category {index}", collection="stand"
+            )
+            CategoryImage.objects.create(category=category, image=f"categories/images/test-{index}.jpg")
+        self.assertEqual(self.get_page_queries(url), queries)
+
+
+@override_settings(**TEST_SETTINGS)
+class ConditionalPageTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        category = Category.objects.create(name_tr="Raf Aksesuarları", name_en="Shelf", collection="part")
+        cls.product = create_product(category, "Raf Klipsi")
+
+    def setUp(self):
+        with override("tr"):
+            self.url = self.product.get_absolute_url()
+
+    def test_etag_answers_304_until_the_site_wide_version_changes(self):
+        etag = self.client.get(self.url).headers["ETag"]
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        flush_page_cache()
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_if_modified_since_alone_does_not_answer_304(self):
+        response = self.client.get(self.url)
+        self.assertNotIn("Last-Modified", response.headers)
+        self.assertEqual(self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=http_date()).status_code, 200)
+
+
+@override_settings(**TEST_SETTINGS)
+class ImageDerivativesTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        category = Category.objects.create(name_tr="Raf Aksesuarları", name_en="Shelf", collection="part")
+        cls.product = create_product(category, "Raf Klipsi")
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        media_override = override_settings(MEDIA_ROOT=media_root)
+        media_override.enable()
+        self.addCleanup(media_override.disable)
+
+    def get_product_page_key(self) -> str:
+        with override("tr"):
+            return get_page_cache_key("http://testserver/", self.product.get_absolute_url(), "tr", None)
+
+    def test_derivatives_are_stored_without_a_second_save(self):
+        saves = []
+
+        def count_save(sender, **kwargs):
+            saves.append(sender)
+
+        post_save.connect(count_save, sender=ProductImage)
+        self.addCleanup(post_save.disconnect, count_save, sender=ProductImage)
+        upload = BytesIO()
+        Image.new("RGB", (700, 400)).save(upload, "PNG")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            image = ProductImage.objects.create(
+                product=self.product, image=SimpleUploadedFile("test.png", upload.getvalue())
+            )
+            page_key = self.get_product_page_key()
+
+        self.assertEqual(len(saves), 1)
+        image.refresh_from_db()
+        webp = image.image_variants["sources"]["webp"]
+        self.assertEqual([width for width, _height, _name in webp], [320, 640, 700])
+        self.assertNotEqual(self.get_product_page_key(), page_key)
@@ -14,6 +14,7 @@ class CategoryTranslationOptions(TranslationOptions):
         "slug",
         "description",
         "rich_text",
+        "rich_text_plain",
     )
     fallback_languages = {"default": ("tr",), "en": ("tr",)}
     fallback_undefined = {
@@ -33,6 +34,7 @@ class ProductTranslationOptions(TranslationOptions):
         "slug",
         "description",
         "rich_text",
+        "rich_text_plain",
     )
     fallback_languages = {"default": ("tr",), "en": ("tr",)}
     fallback_undefined = {
@@ -1,50 +1,52 @@
-from django.db.models import Count
-from django.shortcuts import get_object_or_404, render
+from django.shortcuts import render
 
-from atadizayn_website.core.slug_utils import build_active_language_slug_lookup_q
+from atadizayn_website.core.page_cache_utils import cache_anonymous_page, conditional_page
+from atadizayn_website.core.slug_map_utils import category_slugs, product_slugs, require_known_slugs
 
-from .models import Category, Product
+from .loaders import (
+    get_category_page_last_modified,
+    get_product_page_last_modified,
+    load_category_page_bundle,
+    load_collection_categories,
+    load_product_page_bundle,
+)
 
 
+@cache_anonymous_page
 def part_index(request):
-    # Annotate with the number of variants (SKUs) available
-    categories = Category.objects.filter(collection="part").annotate(items_count=Count("products__variants"))
+    # items_count (variants/SKUs) is stored on Category and kept current by products.signals
+    categories = load_collection_categories("part")
     context = {
         "categories": categories,
     }
     return render(request, "part_index.html", context)
 
 
+@cache_anonymous_page
 def stand_index(request):
-    # Annotate with the number of variants (SKUs) available
-    categories = Category.objects.filter(collection="stand").annotate(items_count=Count("products__variants"))
+    # items_count (variants/SKUs) is stored on Category and kept current by products.signals
+    categories = load_collection_categories("stand")
     context = {
         "categories": categories,
     }
     return render(request, "stand_index.html", context)
 
 
+@require_known_slugs(category_slug=category_slugs)
+@conditional_page(get_category_page_last_modified)
+@cache_anonymous_page
 def category_detail(request, category_slug: str):
-    category = get_object_or_404(Category, build_active_language_slug_lookup_q(category_slug))
-    products = category.products.all()
-    other_categories = Category.objects.exclude(pk=category.pk).order_by("name")[:6]
-
-    context = {
-        "category": category,
-        "products": products,
-        "other_categories": other_categories,
-        "canonical_url": request.build_absolute_uri(category.get_absolute_url()),
-    }
+    # Fixed query count: product cards get their primary image from one prefetch, heavy columns are deferred
+    context = load_category_page_bundle(category_slug)
+    context["canonical_url"] = request.build_absolute_uri(context["category"].get_absolute_url())
     return render(request, "products/category_detail.html", context)
 
 
+@require_known_slugs(category_slug=category_slugs, product_code=product_slugs)
+@conditional_page(get_product_page_last_modified)
+@cache_anonymous_page
 def product_detail(request, category_slug: str, product_code: str):
-    category = get_object_or_404(Category, build_active_language_slug_lookup_q(category_slug))
-    product = get_object_or_404(Product, build_active_language_slug_lookup_q(product_code), category=category)
-
-    context = {
-        "category": category,
-        "product": product,
-        "canonical_url": request.build_absolute_uri(product.get_absolute_url()),
-    }
+    # Category and product come from one join; images, documents and variants are materialized once for the template
+    context = load_product_page_bundle(category_slug, product_code)
+    context["canonical_url"] = request.build_absolute_uri(context["product"].get_absolute_url())
     return render(request, "products/product_detail.html", context)
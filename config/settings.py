@@ -28,6 +28,11 @@ env = environ.Env(
     SECURE_SSL_REDIRECT=(bool),
     SECURE_HSTS_SECONDS=(int, 31536000),
     IS_BEHIND_PROXY=(bool),
+    CACHE_URL=(str, "locmemcache://"),
+    SEARCH_CACHE_TIMEOUT=(int, 300),
+    SEARCH_CACHE_MAX_ENTRIES=(int, 1000),
+    PAGE_CACHE_TIMEOUT=(int, 600),
+    PROCESS_CACHE_TIMEOUT=(int, 60),
 )
 
 env_file = BASE_DIR / ".env"
@@ -89,6 +94,7 @@ TEMPLATES = [
                 "atadizayn_website.products.context_processors.footer_categories",
                 "atadizayn_website.core.context_processors.footer_blog_collections",
                 "atadizayn_website.core.context_processors.canonical_url",
+                "atadizayn_website.core.context_processors.language_switch_urls",
             ],
         },
     },
@@ -107,6 +113,24 @@ DATABASES = {
     }
 }
 
+CACHES = {
+    "default": env.cache("CACHE_URL"),
+    # Per-process search result IDs; entries are keyed by a version kept in the default cache.
+    "search": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "search-results",
+        "TIMEOUT": env.int("SEARCH_CACHE_TIMEOUT"),
+        "OPTIONS": {"MAX_ENTRIES": env.int("SEARCH_CACHE_MAX_ENTRIES")},
+    },
+}
+
+# Rendered pages for anonymous visitors, stored in the default cache; 0 disables the page cache.
+PAGE_CACHE_TIMEOUT = env.int("PAGE_CACHE_TIMEOUT")
+
+# Lifetime of the per-process lookup tables (site config, assets, suggest index, slug maps). Version bumps
+# reload them at once only when CACHE_URL is shared between workers; otherwise this bounds their staleness.
+PROCESS_CACHE_TIMEOUT = env.int("PROCESS_CACHE_TIMEOUT")
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
@@ -153,6 +177,13 @@ USE_TZ = True
 
 STATIC_URL = "static/"
 STATIC_ROOT = BASE_DIR / "staticfiles"
+# Pre-rendered pages written by `manage.py export_static_site`.
+STATIC_EXPORT_ROOT = BASE_DIR / "export"
+# URLs (one per language) per sitemap file written by `manage.py generate_sitemaps`; the protocol allows 50000.
+SITEMAP_CHUNK_SIZE = 5000
+# Widths (px) and formats of the derivatives generated for uploaded images (see core.image_utils).
+RESPONSIVE_IMAGE_WIDTHS = (320, 640, 960, 1280, 1920)
+RESPONSIVE_IMAGE_FORMATS = ("avif", "webp")
 STATICFILES_DIRS = [BASE_DIR / "static"]
 
 MEDIA_STORAGE = env("MEDIA_STORAGE")
@@ -19,12 +19,12 @@ from django.conf import settings
 from django.conf.urls.i18n import i18n_patterns
 from django.conf.urls.static import static
 from django.contrib import admin
-from django.contrib.sitemaps.views import sitemap
 from django.urls import include, path
 from django.views.generic import TemplateView
 
 from atadizayn_website.blog.sitemaps import BlogPostSitemap
 from atadizayn_website.core.sitemaps import StaticViewSitemap
+from atadizayn_website.core.views import sitemap_file, switch_language
 from atadizayn_website.products.sitemaps import CategorySitemap, ProductSitemap
 
 sitemaps = {
@@ -35,10 +35,12 @@ sitemaps = {
 }
 
 urlpatterns = [
+    path("i18n/switch/<str:lang_code>/", switch_language, name="switch_language"),
     path("i18n/", include("django.conf.urls.i18n")),
     path("ckeditor5/", include("django_ckeditor_5.urls")),
     path("kitchen_sink/", TemplateView.as_view(template_name="kitchen_sink.html"), name="kitchen_sink"),
-    path("sitemap.xml", sitemap, {"sitemaps": sitemaps}, name="django.contrib.sitemaps.views.sitemap"),
+    path("sitemap.xml", sitemap_file, {"sitemaps": sitemaps}, name="django.contrib.sitemaps.views.sitemap"),
+    path("sitemap-<slug:section>-<int:page>.xml", sitemap_file, {"sitemaps": sitemaps}, name="sitemap_section"),
 ]
 
 urlpatterns += i18n_patterns(
@@ -48,5 +50,7 @@ urlpatterns += i18n_patterns(
     path("", include("atadizayn_website.products.urls")),
 )
 
+handler404 = "atadizayn_website.core.views.page_not_found"
+
 if settings.MEDIA_STORAGE == "local":
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
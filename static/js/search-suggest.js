@@ -0,0 +1,62 @@
+(function() {
+  const inputs = document.querySelectorAll('input[data-suggest-url]');
+  if (!inputs.length) return;
+
+  const DEBOUNCE_MS = 150;
+  const MIN_LENGTH = 2;
+
+  inputs.forEach((input) => {
+    const form = input.form;
+    const menu = document.createElement('ul');
+    menu.className = 'dropdown-menu shadow-lg border-0';
+    menu.setAttribute('role', 'listbox');
+    form.classList.add('position-relative');
+    form.appendChild(menu);
+
+    let timer = null;
+    let controller = null;
+
+    const hide = () => menu.classList.remove('show');
+
+    const render = (results) => {
+      menu.replaceChildren();
+      results.forEach((item) => {
+        const link = document.createElement('a');
+        link.className = 'dropdown-item';
+        link.href = item.url;
+        link.textContent = item.label;
+        const li = document.createElement('li');
+        li.appendChild(link);
+        menu.appendChild(li);
+      });
+      menu.classList.toggle('show', results.length > 0);
+    };
+
+    const fetchSuggestions = () => {
+      const query = input.value.trim();
+      if (query.length < MIN_LENGTH) {
+        hide();
+        return;
+      }
+      if (controller) controller.abort();
+      controller = new AbortController();
+      const url = `${input.dataset.suggestUrl}?q=${encodeURIComponent(query)}`;
+      fetch(url, { signal: controller.signal, headers: { Accept: 'application/json' } })
+        .then((response) => (response.ok ? response.json() : { results: [] }))
+        .then((data) => render(data.results))
+        .catch(() => {});
+    };
+
+    input.setAttribute('autocomplete', 'off');
+    input.addEventListener('input', () => {
+      clearTimeout(timer);
+      timer = setTimeout(fetchSuggestions, DEBOUNCE_MS);
+    });
+    input.addEventListener('keydown', (event) => {
+      if (event.key === 'Escape') hide();
+    });
+    document.addEventListener('click', (event) => {
+      if (!form.contains(event.target)) hide();
+    });
+  });
+})();